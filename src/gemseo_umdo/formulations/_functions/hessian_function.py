@@ -18,14 +18,154 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Callable
+from typing import Final
 
 from gemseo.algos.database import Database
+from gemseo.algos.hashable_ndarray import HashableNdarray
 from gemseo.core.mdo_functions.mdo_function import MDOFunction
 from gemseo.utils.derivatives.finite_differences import FirstOrderFD
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import full
+from numpy import newaxis
+from numpy import nonzero
+from numpy import zeros
+from numpy.linalg import norm
 
 if TYPE_CHECKING:
     from gemseo.typing import NumberArray
     from gemseo.typing import RealArray
+    from numpy.typing import NDArray
+
+
+class _MemoizedFunction:
+    """A function caching its evaluations.
+
+    The finite difference stencils used to approximate the Hessian matrix
+    evaluate the original function several times at the same input points;
+    these evaluations are computed once.
+    The cache is not bounded
+    as it is cleared before each approximation of the Hessian matrix.
+    """
+
+    __cache: dict[HashableNdarray, NumberArray]
+    """The cached output data bound to the input data."""
+
+    __function: Callable[[NumberArray], NumberArray]
+    """The function to evaluate."""
+
+    def __init__(self, function: Callable[[NumberArray], NumberArray]) -> None:
+        """
+        Args:
+            function: The function to evaluate.
+        """  # noqa: D205 D212 D415
+        self.__cache = {}
+        self.__function = function
+
+    def __call__(self, input_data: NumberArray) -> NumberArray:
+        """Evaluate the function or return the cached output data.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The output data.
+        """
+        key = HashableNdarray(input_data.copy())
+        cache = self.__cache
+        output_data = cache.get(key)
+        if output_data is None:
+            output_data = cache[key] = self.__function(input_data)
+
+        return output_data
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self.__cache.clear()
+
+
+class HessianStencil:
+    """The Jacobian evaluations shared by Hessian functions.
+
+    The Hessian functions using the same stencil
+    are assumed to be evaluated together at the same input point;
+    the Jacobians of their original functions are evaluated
+    at each point of the finite difference stencil once for all,
+    so that the disciplines are executed once per point
+    instead of once per point and per function.
+    The shared Jacobians are discarded
+    as soon as the input point changes
+    or a Hessian function is evaluated again.
+    """
+
+    __center: HashableNdarray | None
+    """The input point at which the Hessian functions are evaluated."""
+
+    __evaluated_indices: set[int]
+    """The indices of the Hessian functions evaluated at the current input point."""
+
+    __hessian_functions: list[HessianFunction]
+    """The Hessian functions using the stencil."""
+
+    __jacobians: dict[HashableNdarray, list[RealArray]]
+    """The Jacobians of the original functions bound to the stencil points."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.__center = None
+        self.__evaluated_indices = set()
+        self.__hessian_functions = []
+        self.__jacobians = {}
+
+    def add_function(self, hessian_function: HessianFunction) -> int:
+        """Add a Hessian function using the stencil.
+
+        Args:
+            hessian_function: The Hessian function.
+
+        Returns:
+            The index of the Hessian function.
+        """
+        self.__hessian_functions.append(hessian_function)
+        self.__center = None
+        return len(self.__hessian_functions) - 1
+
+    def prepare(self, index: int, input_data: RealArray) -> None:
+        """Prepare the evaluation of a Hessian function.
+
+        Args:
+            index: The index of the Hessian function.
+            input_data: The input data.
+        """
+        center = HashableNdarray(input_data.copy())
+        if index in self.__evaluated_indices or center != self.__center:
+            self.__center = center
+            self.__evaluated_indices.clear()
+            self.__jacobians.clear()
+            for hessian_function in self.__hessian_functions:
+                hessian_function._prepare(input_data)
+
+        self.__evaluated_indices.add(index)
+
+    def compute_jacobian(self, index: int, input_data: RealArray) -> RealArray:
+        """Return the Jacobian of an original function at a stencil point.
+
+        Args:
+            index: The index of the Hessian function.
+            input_data: The stencil point.
+
+        Returns:
+            The Jacobian of the original function.
+        """
+        key = HashableNdarray(input_data.copy())
+        jacobians = self.__jacobians.get(key)
+        if jacobians is None:
+            jacobians = self.__jacobians[key] = [
+                hessian_function._compute_jac(input_data)
+                for hessian_function in self.__hessian_functions
+            ]
+
+        return jacobians[index]
 
 
 class HessianFunction(MDOFunction):
@@ -33,22 +173,184 @@ class HessianFunction(MDOFunction):
 
     Take an original function and approximate its Hessian with finite differences
     applied to its analytical or approximated Jacobian.
+
+    The differentiation step is relative to the norm of the input data,
+    with a lower bound, and is computed at each evaluation.
+
+    When the sparsity pattern of the Hessian matrix is known,
+    the input variables are grouped by colors
+    so that two input variables with the same color
+    do not have a common non-zero row in the Hessian matrix.
+    Then,
+    the input data are perturbed along one direction per color
+    instead of one direction per input variable.
+
+    Several Hessian functions evaluated at the same input point
+    can share a [HessianStencil][gemseo_umdo.formulations._functions.hessian_function.HessianStencil]
+    to evaluate the Jacobians of their original functions together.
+    """  # noqa: E501
+
+    __MINIMUM_STEP: Final[float] = 1e-6
+    """The minimum differentiation step."""
+
+    __colored_indices: tuple[NDArray[int], NDArray[int], NDArray[int]] | None
+    """The rows, columns and colors of the non-zero elements of the Hessian matrix.
+
+    `None` when the Hessian matrix is considered as dense.
     """
 
+    __hessian_approximator: FirstOrderFD
+    """The finite difference approximator of the Hessian matrix."""
+
+    __index: int
+    """The index of the Hessian function in the stencil."""
+
     __jac: Callable[[NumberArray], NumberArray]
     """The function computing the Jacobian."""
 
-    def __init__(self, func: MDOFunction) -> None:
+    __jac_approximator: FirstOrderFD
+    """The finite difference approximator of the Jacobian of the original function.
+
+    Only used when the original function has no analytical Jacobian.
+    """
+
+    __memoized_function: _MemoizedFunction | None
+    """The original function caching its evaluations, if its Jacobian is approximated.
+
+    The cache is cleared before each approximation of the Hessian matrix
+    as the original function depends on the design variables.
+    """
+
+    __seed_matrix: RealArray | None
+    """The perturbation directions, one per color, shaped as `(n_inputs, n_colors)`.
+
+    `None` when the Hessian matrix is considered as dense.
+    """
+
+    __stencil: HessianStencil
+    """The Jacobian evaluations shared with other Hessian functions."""
+
+    __step: float
+    """The differentiation step used by the current approximation."""
+
+    def __init__(
+        self,
+        func: MDOFunction,
+        sparsity_pattern: NDArray[bool] | None = None,
+        stencil: HessianStencil | None = None,
+    ) -> None:
         """
         Args:
             func: The original function.
+            sparsity_pattern: The sparsity pattern of the Hessian matrix,
+                shaped as `(n_inputs, n_inputs)`,
+                where `True` indicates a non-zero element.
+                If `None`, consider the Hessian matrix as dense.
+            stencil: The Jacobian evaluations shared with other Hessian functions.
+                If `None`, do not share them.
         """  # noqa: D205 D212 D415
-        self.__jac = func.jac if func.has_jac else FirstOrderFD(func.func).f_gradient
+        self.__step = self.__MINIMUM_STEP
+        if sparsity_pattern is None:
+            self.__colored_indices = self.__seed_matrix = None
+        else:
+            sparsity_pattern = asarray(sparsity_pattern, dtype=bool)
+            colors = self.__color_columns(sparsity_pattern)
+            rows, columns = nonzero(sparsity_pattern)
+            self.__colored_indices = (rows, columns, colors[columns])
+            self.__seed_matrix = (
+                colors[:, newaxis] == arange(colors.max() + 1)
+            ).astype(float)
+
+        if func.has_jac:
+            self.__memoized_function = None
+            self.__jac = func.jac
+        else:
+            self.__memoized_function = _MemoizedFunction(func.func)
+            self.__jac_approximator = FirstOrderFD(self.__memoized_function)
+            self.__jac = self._approximate_jac
+
+        self.__stencil = HessianStencil() if stencil is None else stencil
+        self.__index = self.__stencil.add_function(self)
+        self.__hessian_approximator = FirstOrderFD(self._compute_stencil_jac)
         grad_tag = Database.GRAD_TAG
-        super().__init__(
-            FirstOrderFD(self._compute_jac).f_gradient,
-            f"{grad_tag}{grad_tag}{func.name}",
-        )
+        super().__init__(self._compute_hessian, f"{grad_tag}{grad_tag}{func.name}")
+
+    def _prepare(self, input_data: RealArray) -> None:
+        """Prepare the finite difference approximations at a new input point.
+
+        Args:
+            input_data: The input data.
+        """
+        if self.__memoized_function is not None:
+            self.__memoized_function.clear()
+
+        self.__step = max(self.__MINIMUM_STEP, self.__MINIMUM_STEP * norm(input_data))
+
+    def _compute_hessian(self, input_data: RealArray) -> RealArray:
+        """Compute the Hessian matrix.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The Hessian matrix.
+        """
+        self.__stencil.prepare(self.__index, input_data)
+        step = self.__step
+        if self.__seed_matrix is None:
+            return self.__hessian_approximator.f_gradient(input_data, step=step)
+
+        input_dimension = len(input_data)
+        jac = self._compute_stencil_jac(input_data).reshape(input_dimension, -1)
+        compressed_hessian = array([
+            (
+                self._compute_stencil_jac(input_data + step * direction).reshape(
+                    input_dimension, -1
+                )
+                - jac
+            )
+            / step
+            for direction in self.__seed_matrix.T
+        ])
+        rows, columns, colors = self.__colored_indices
+        hessian = zeros((jac.shape[1], input_dimension, input_dimension))
+        hessian[:, rows, columns] = compressed_hessian[colors, rows].T
+        return hessian
+
+    @staticmethod
+    def __color_columns(sparsity_pattern: NDArray[bool]) -> NDArray[int]:
+        """Color the columns of a sparse matrix with a greedy algorithm.
+
+        Two columns with a common non-zero row have different colors.
+
+        Args:
+            sparsity_pattern: The sparsity pattern of the matrix.
+
+        Returns:
+            The color of each column.
+        """
+        colors = full(sparsity_pattern.shape[1], -1)
+        for column, column_pattern in enumerate(sparsity_pattern.T):
+            conflicting_columns = column_pattern @ sparsity_pattern
+            used_colors = set(colors[conflicting_columns])
+            color = 0
+            while color in used_colors:
+                color += 1
+
+            colors[column] = color
+
+        return colors
+
+    def _approximate_jac(self, input_data: RealArray) -> RealArray:
+        """Approximate the Jacobian matrix of the original function.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The Jacobian matrix.
+        """
+        return self.__jac_approximator.f_gradient(input_data, step=self.__step)
 
     def _compute_jac(self, input_data: RealArray) -> RealArray:
         """Compute the Jacobian matrix.
@@ -60,3 +362,14 @@ class HessianFunction(MDOFunction):
             The Jacobian matrix.
         """
         return self.__jac(input_data).T
+
+    def _compute_stencil_jac(self, input_data: RealArray) -> RealArray:
+        """Compute the Jacobian matrix at a point of the shared stencil.
+
+        Args:
+            input_data: The input data.
+
+        Returns:
+            The Jacobian matrix.
+        """
+        return self.__stencil.compute_jacobian(self.__index, input_data)
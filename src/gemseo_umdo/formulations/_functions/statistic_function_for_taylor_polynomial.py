@@ -70,11 +70,13 @@ class StatisticFunctionForTaylorPolynomial(BaseStatisticFunction[TaylorPolynomia
         problem = formulation.auxiliary_mdo_formulation.optimization_problem
         database = problem.database
         formulation.evaluate_with_mean(problem, True)
+        # The functions and their Jacobians are evaluated once at the mean
+        # and shared by all the statistic functions evaluated at the same input data.
         for function in problem.functions:
             name = function.name
             output_data[name] = atleast_1d(function.last_eval)
             output_data[database.get_gradient_name(name)] = atleast_2d(
-                database.get_gradient_history(self._function_name)[0]
+                database.get_gradient_history(name)[0]
             )
 
         if formulation.second_order:
@@ -45,6 +45,7 @@ from gemseo.core.mdo_functions.mdo_function import MDOFunction
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 
 from gemseo_umdo.formulations._functions.hessian_function import HessianFunction
+from gemseo_umdo.formulations._functions.hessian_function import HessianStencil
 from gemseo_umdo.formulations._functions.statistic_function_for_taylor_polynomial import (  # noqa: E501
     StatisticFunctionForTaylorPolynomial,
 )
@@ -76,6 +77,9 @@ class TaylorPolynomial(BaseUMDOFormulation):
     __hessian_fd_problem: OptimizationProblem | None
     """The problem related to the approximation of the Hessian if any."""
 
+    __hessian_stencil: HessianStencil
+    """The Jacobian evaluations shared by the Hessian functions."""
+
     _STATISTIC_FACTORY: ClassVar[TaylorPolynomialEstimatorFactory] = (
         TaylorPolynomialEstimatorFactory()
     )
@@ -109,10 +113,15 @@ class TaylorPolynomial(BaseUMDOFormulation):
         )
 
         self.__hessian_fd_problem = None
+        self.__hessian_stencil = HessianStencil()
         problem = self._auxiliary_mdo_formulation.optimization_problem
         if settings_model.second_order:
             self.__hessian_fd_problem = OptimizationProblem(self.uncertain_space)
-            self.__hessian_fd_problem.objective = HessianFunction(problem.objective)
+            self.__hessian_fd_problem.objective = HessianFunction(
+                problem.objective,
+                settings_model.hessian_sparsity_pattern,
+                self.__hessian_stencil,
+            )
 
         problem.differentiation_method = settings_model.differentiation_method
         problem.design_space = problem.design_space.to_design_space()
@@ -150,12 +159,7 @@ class TaylorPolynomial(BaseUMDOFormulation):
             positive=positive,
             **statistic_parameters,
         )
-        if self.hessian_fd_problem is not None:
-            self.hessian_fd_problem.add_observable(
-                HessianFunction(
-                    self._auxiliary_mdo_formulation.optimization_problem.observables[-1]
-                )
-            )
+        self.__add_hessian_observable()
 
     def add_observable(  # noqa: D102
         self,
@@ -172,11 +176,22 @@ class TaylorPolynomial(BaseUMDOFormulation):
             discipline=discipline,
             **statistic_parameters,
         )
-        if self.hessian_fd_problem is not None:
-            self.hessian_fd_problem.add_observable(
+        self.__add_hessian_observable()
+
+    def __add_hessian_observable(self) -> None:
+        """Approximate the Hessian of the last observable of the auxiliary problem.
+
+        Nothing is done when the Taylor polynomials are of first order.
+        """
+        if self.__hessian_fd_problem is not None:
+            self.__hessian_fd_problem.add_observable(
                 HessianFunction(
-                    self._auxiliary_mdo_formulation.optimization_problem.observables[-1]
-                ),
+                    self._auxiliary_mdo_formulation.optimization_problem.observables[
+                        -1
+                    ],
+                    self._settings.hessian_sparsity_pattern,
+                    self.__hessian_stencil,
+                )
             )
 
     def evaluate_with_mean(self, problem: OptimizationProblem, eval_jac: bool) -> None:
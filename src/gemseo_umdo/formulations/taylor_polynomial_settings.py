@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from gemseo.algos.optimization_problem import OptimizationProblem
+from gemseo.utils.pydantic_ndarray import NDArrayPydantic  # noqa: TC002
 from pydantic import Field
 
 from gemseo_umdo.formulations.base_umdo_formulation_settings import (
@@ -39,3 +40,17 @@ class TaylorPolynomial_Settings(BaseUMDOFormulationSettings):  # noqa: N801
         description="Whether to use second-order Taylor polynomials "
         "instead of first-order Taylor polynomials.",
     )
+
+    hessian_sparsity_pattern: NDArrayPydantic[bool] | None = Field(
+        default=None,
+        description="""The sparsity pattern of the Hessian matrices
+with respect to the uncertain variables,
+shaped as `(uncertain_dimension, uncertain_dimension)`,
+where `True` indicates a non-zero element.
+When the Hessian matrices are approximated by finite differences,
+the uncertain variables without common non-zero rows are perturbed together,
+which reduces the number of evaluations.
+If `None`, consider the Hessian matrices as dense.
+
+This argument is ignored when `second_order` is `False`.""",
+    )
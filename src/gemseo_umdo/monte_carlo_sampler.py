@@ -18,21 +18,43 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Callable
+from typing import Final
 
 from gemseo.algos.doe.openturns.openturns import OpenTURNS
+from gemseo.algos.parameter_space import ParameterSpace
+from gemseo.uncertainty.distributions.openturns.joint import OTJointDistribution
+from gemseo.utils.seeder import Seeder
 from numpy import array
+from numpy import concatenate
+from numpy import empty
 from numpy import hstack
 from numpy import vstack
 from numpy.typing import NDArray
+from openturns import RandomGenerator
+from openturns import Uniform
 
 if TYPE_CHECKING:
     from gemseo.algos.design_space import DesignSpace
+    from openturns import Distribution
 
 FunctionType = Callable[[NDArray[float]], NDArray[float]]
 
 
 class MonteCarloSampler:
-    """A Monte Carlo sampler taking advantage of the vectorized functions."""
+    """A Monte Carlo sampler taking advantage of the vectorized functions.
+
+    When the input space is a parameter space
+    whose variables are all random variables
+    defined with OpenTURNS distributions,
+    the input samples are obtained by applying
+    the inverse cumulative distribution function of each marginal
+    to the whole sample at once
+    instead of sample by sample with the OpenTURNS DOE library.
+    The input samples are the same.
+    """
+
+    __STANDARD_UNIFORM_DISTRIBUTION: Final[Uniform] = Uniform(0, 1)
+    """The uniform distribution over the interval $[0,1]$."""
 
     __algo: OpenTURNS
     """The Monte Carlo algorithm."""
@@ -40,14 +62,45 @@ class MonteCarloSampler:
     __functions: list[FunctionType]
     """The functions to sample."""
 
+    __functions_are_vectorized: list[bool]
+    """Whether the functions to sample are vectorized."""
+
     __input_space: DesignSpace
     """The input space on which to sample the functions."""
 
-    __input_histories: list[NDArray[float]]
-    """One history of the function inputs per call to the sampler."""
+    __input_history: NDArray[float]
+    """The history of the function inputs."""
+
+    __linear_columns: NDArray[int]
+    """The columns of the output samples corresponding to the linear functions."""
+
+    __linear_kernel: tuple[NDArray[float], NDArray[float]] | None
+    """The coefficients and intercepts of the linear functions stacked row-wise.
+
+    `None` when no function is linear.
+    """
+
+    __linear_kernels: list[tuple[NDArray[float], NDArray[float]] | None]
+    """The coefficients and intercept of each function if linear."""
 
-    __output_histories: list[NDArray[float]]
-    """One history of the function outputs per call to the sampler."""
+    __marginals: list[Distribution]
+    """The OpenTURNS marginal distributions of the components of the input space.
+
+    Empty when the input samples are generated with the OpenTURNS DOE library.
+    """
+
+    __output_history: NDArray[float]
+    """The history of the function outputs."""
+
+    __output_slices: list[slice]
+    """The columns of the output samples corresponding to each function.
+
+    These columns are set at the first call to the sampler
+    following the addition of a function.
+    """
+
+    __seeder: Seeder
+    """The seed generator used when the OpenTURNS DOE library is bypassed."""
 
     def __init__(self, input_space: DesignSpace) -> None:
         """
@@ -56,20 +109,62 @@ class MonteCarloSampler:
         """  # noqa:D205 D212 D415
         self.__algo = OpenTURNS("OT_MONTE_CARLO")
         self.__functions = []
+        self.__functions_are_vectorized = []
         self.__input_space = input_space
-        self.__input_histories = []
-        self.__output_histories = []
-        self.__all_functions_are_vectorized = True
+        self.__input_history = empty((0, input_space.dimension))
+        self.__linear_columns = array([], dtype=int)
+        self.__linear_kernel = None
+        self.__linear_kernels = []
+        self.__marginals = []
+        if (
+            isinstance(input_space, ParameterSpace)
+            and not input_space.deterministic_variables
+            and isinstance(input_space.distribution, OTJointDistribution)
+        ):
+            self.__marginals = [
+                marginal.distribution for marginal in input_space.distribution.marginals
+            ]
+
+        self.__output_history = empty((0, 0))
+        self.__output_slices = []
+        self.__seeder = Seeder()
 
-    def add_function(self, function: FunctionType, is_vectorized: bool = True) -> None:
+    def add_function(
+        self,
+        function: FunctionType,
+        is_vectorized: bool = True,
+        linear_kernel: tuple[NDArray[float], NDArray[float]] | None = None,
+    ) -> None:
         """Add a function to sample.
 
+        The histories are reset
+        as the previous output samples do not include the outputs of this function.
+
         Args:
             function: A function to sample.
             is_vectorized: Whether the function is vectorized.
+            linear_kernel: The coefficients $A$ and the intercept $b$
+                of the function if it is linear, i.e. $f(x)=Ax+b$,
+                shaped as `(output_dimension, input_dimension)`
+                and `(output_dimension,)`.
+                Then,
+                the linear functions are evaluated
+                with a single matrix product
+                and `function` is not called.
+                If `None`, the function is not linear.
         """
-        self.__all_functions_are_vectorized &= is_vectorized
         self.__functions.append(function)
+        self.__functions_are_vectorized.append(is_vectorized)
+        self.__linear_kernels.append(linear_kernel)
+        self.__output_slices = []
+        self.__input_history = empty((0, self.__input_space.dimension))
+        self.__output_history = empty((0, 0))
+        if linear_kernel is not None:
+            linear_kernels = [k for k in self.__linear_kernels if k is not None]
+            self.__linear_kernel = (
+                vstack([coefficients for coefficients, _ in linear_kernels]),
+                hstack([intercept for _, intercept in linear_kernels]),
+            )
 
     def __call__(
         self, n_samples: int, seed: int | None = None
@@ -80,41 +175,175 @@ class MonteCarloSampler:
             n_samples: The number of samples.
             seed: The seed value.
                 If `None`,
-                use the [OpenTURNS.seed][gemseo.algos.doe.lib_openturns.OpenTURNS.seed].
+                use the default seed incremented at each call.
 
         Returns:
             The input and output samples.
         """
-        input_samples = self.__algo.compute_doe(
-            self.__input_space, n_samples=n_samples, seed=seed
+        input_samples = self.__compute_input_samples(n_samples, seed)
+        linear_output_samples = None
+        if self.__linear_kernel is not None:
+            # The linear functions are evaluated with a single matrix product.
+            coefficients, intercept = self.__linear_kernel
+            linear_output_samples = input_samples @ coefficients.T + intercept
+
+        functions = zip(
+            self.__functions, self.__functions_are_vectorized, self.__linear_kernels
         )
-        if self.__all_functions_are_vectorized:
-            output_samples = [
-                function.evaluate(input_samples) for function in self.__functions
-            ]
+        if len(self.__output_slices) == len(self.__functions):
+            # The output samples are written in a single pre-allocated array.
+            output_samples = empty((n_samples, self.__output_slices[-1].stop))
+            if linear_output_samples is not None:
+                output_samples[:, self.__linear_columns] = linear_output_samples
+
+            for (function, is_vectorized, linear_kernel), output_slice in zip(
+                functions, self.__output_slices
+            ):
+                if linear_kernel is not None:
+                    continue
+
+                if is_vectorized:
+                    output_samples[:, output_slice] = function.evaluate(input_samples)
+                else:
+                    for input_sample, output_sample in zip(
+                        input_samples, output_samples[:, output_slice]
+                    ):
+                        output_sample[:] = function(input_sample)
         else:
-            output_samples = [
-                vstack([function(input_sample) for input_sample in input_samples])
-                for function in self.__functions
-            ]
+            # Only the functions that are not vectorized are evaluated sample by sample.
+            output_samples = []
+            linear_start = 0
+            for function, is_vectorized, linear_kernel in functions:
+                if linear_kernel is not None:
+                    linear_stop = linear_start + len(linear_kernel[0])
+                    output_samples.append(
+                        linear_output_samples[:, linear_start:linear_stop]
+                    )
+                    linear_start = linear_stop
+                elif is_vectorized:
+                    output_samples.append(function.evaluate(input_samples))
+                else:
+                    output_samples.append(
+                        self.__evaluate_sample_by_sample(function, input_samples)
+                    )
+
+            self.__output_slices = []
+            linear_columns = []
+            start = 0
+            for function_output_samples, linear_kernel in zip(
+                output_samples, self.__linear_kernels
+            ):
+                stop = start + function_output_samples.shape[1]
+                self.__output_slices.append(slice(start, stop))
+                if linear_kernel is not None:
+                    linear_columns.extend(range(start, stop))
+
+                start = stop
+
+            self.__linear_columns = array(linear_columns, dtype=int)
+            output_samples = concatenate(
+                output_samples, axis=1, out=empty((n_samples, stop))
+            )
+
+        # The histories are stacked at each call
+        # so that reading them does not require stacking the previous samples.
+        self.__input_history = vstack((self.__input_history, input_samples))
+        if len(self.__output_history):
+            self.__output_history = vstack((self.__output_history, output_samples))
+        else:
+            # The output dimension is not known before the first call.
+            self.__output_history = output_samples.copy()
 
-        output_samples = hstack(output_samples)
-        self.__input_histories.append(input_samples)
-        self.__output_histories.append(output_samples)
         return input_samples, output_samples
 
+    def __compute_input_samples(
+        self, n_samples: int, seed: int | None
+    ) -> NDArray[float]:
+        """Sample the input space with a Monte Carlo algorithm.
+
+        Args:
+            n_samples: The number of samples.
+            seed: The seed value.
+                If `None`,
+                use the default seed incremented at each call.
+
+        Returns:
+            The input samples.
+        """
+        if not self.__marginals:
+            return self.__algo.compute_doe(
+                self.__input_space, n_samples=n_samples, seed=seed
+            )
+
+        # This reproduces OpenTURNS.compute_doe
+        # with a vectorized evaluation of the inverse cumulative distribution functions.
+        RandomGenerator.SetSeed(self.__seeder.get_seed(seed))
+        dimension = len(self.__marginals)
+        unit_samples = array(
+            self.__STANDARD_UNIFORM_DISTRIBUTION.getSample(dimension * n_samples)
+        ).reshape((n_samples, dimension))
+        input_samples = empty((n_samples, dimension))
+        for i, marginal in enumerate(self.__marginals):
+            input_samples[:, i] = array(
+                marginal.computeQuantile(unit_samples[:, i])
+            ).ravel()
+
+        return input_samples
+
+    @staticmethod
+    def __evaluate_sample_by_sample(
+        function: FunctionType, input_samples: NDArray[float]
+    ) -> NDArray[float]:
+        """Evaluate a function that is not vectorized.
+
+        Args:
+            function: The function.
+            input_samples: The input samples.
+
+        Returns:
+            The output samples.
+        """
+        output_sample = function(input_samples[0])
+        output_samples = empty((len(input_samples), output_sample.size))
+        output_samples[0] = output_sample
+        for input_sample, output_sample in zip(input_samples[1:], output_samples[1:]):
+            output_sample[:] = function(input_sample)
+
+        return output_samples
+
+    @staticmethod
+    def __get_read_only_view(history: NDArray[float]) -> NDArray[float]:
+        """Return a read-only view of a history.
+
+        Args:
+            history: The history.
+
+        Returns:
+            The read-only view of the history.
+        """
+        view = history.view()
+        view.flags.writeable = False
+        return view
+
     @property
     def input_history(self) -> NDArray[float]:
-        """The history of the function inputs."""
-        if self.__input_histories:
-            return vstack(self.__input_histories)
+        """The history of the function inputs.
+
+        Before the first call to the sampler,
+        this is an empty array shaped as `(0, input_dimension)`.
 
-        return array(())
+        This array is read-only.
+        """
+        return self.__get_read_only_view(self.__input_history)
 
     @property
     def output_history(self) -> NDArray[float]:
-        """The history of the function outputs."""
-        if self.__output_histories:
-            return vstack(self.__output_histories)
+        """The history of the function outputs.
+
+        Before the first call to the sampler,
+        this is an empty array shaped as `(0, 0)`
+        as the output dimension is not known yet.
 
-        return array(())
+        This array is read-only.
+        """
+        return self.__get_read_only_view(self.__output_history)
@@ -20,15 +20,16 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Final
 
-from gemseo.core.chains.chain import MDOChain
 from gemseo.core.mdo_functions.mdo_function import MDOFunction
-from gemseo.disciplines.analytic import AnalyticDiscipline
 from gemseo.formulations.factory import MDOFormulationFactory
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 from gemseo.utils.string_tools import MultiLineString
 from gemseo.utils.string_tools import pretty_str
+from sympy import Symbol
+from sympy.parsing.sympy_parser import parse_expr
 
-from gemseo_umdo.disciplines.noiser_factory import NoiserFactory
+from gemseo_umdo.disciplines.additive_noiser import AdditiveNoiser
+from gemseo_umdo.disciplines.multiplicative_noiser import MultiplicativeNoiser
 from gemseo_umdo.formulations.factory import UMDOFormulationsFactory
 
 if TYPE_CHECKING:
@@ -53,6 +54,14 @@ class BaseUScenario:
 
     __DV_TAG: Final[str] = "{}"
     __DV_PREFIX: Final[str] = "dv_"
+
+    __formulation_description: tuple[str, str, str]
+    """The disciplines, MDO formulation and U-MDO formulation for the representation.
+
+    These objects are set at instantiation
+    while the name and the uncertain space can be modified afterwards.
+    """
+
     formulation: BaseUMDOFormulation
 
     def __init__(
@@ -112,6 +121,8 @@ class BaseUScenario:
                 and `"{}"` is the optimization variable.
                 Leave `"{}"` as is; it will be automatically replaced by `"dv_x"`.
                 This more complex format assumes variables of dimension 1.
+                Note that an expression equivalent to `"{} + u"` or `"{} * (1 + u)"`
+                is evaluated by the corresponding noising discipline.
                 If `None`,
                 do not consider other variable relations
                 than those defined by `disciplines`.
@@ -127,7 +138,12 @@ class BaseUScenario:
         mdo_formulation_class = MDOFormulationFactory().get_class(formulation_name)
 
         # Create the design space associated with the optimization problem
-        # generated by the MDO formulation
+        # generated by the MDO formulation.
+        # This formulation cannot be replaced by a filtering of the design space:
+        # depending on the MDO formulation,
+        # the design variables can be removed (e.g. MDF removes the couplings)
+        # or added (e.g. IDF adds the couplings)
+        # and the default input values of the disciplines are set.
         mdo_formulation_design_space = mdo_formulation_class(
             disciplines,
             objective_name,
@@ -162,6 +178,11 @@ class BaseUScenario:
         )
 
         self.formulation_name = self.formulation.name
+        self.__formulation_description = (
+            pretty_str(self.disciplines, delimiter=" "),
+            self.mdo_formulation.__class__.__name__,
+            self.formulation.__class__.__name__,
+        )
 
     def __add_noising_discipline_chain(
         self,
@@ -179,31 +200,80 @@ class BaseUScenario:
             uncertain_design_variables: The argument facilitating
                 the definition of uncertain design variables.
         """
-        noising_disciplines = []
+        # These imports are only needed when some design variables are uncertain.
+        from gemseo.core.chains.chain import MDOChain
+        from gemseo.disciplines.analytic import AnalyticDiscipline
 
-        expressions = {
-            dv_name: v
-            for dv_name, v in uncertain_design_variables.items()
-            if isinstance(v, str)
-        }
-        for dv_name, expression in expressions.items():
-            new_dv_name = self.__get_design_variable_name(dv_name)
-            design_space.rename_variable(dv_name, new_dv_name)
-            expressions[dv_name] = expression.replace(self.__DV_TAG, new_dv_name)
+        from gemseo_umdo.disciplines.noiser_factory import NoiserFactory
 
-        noising_disciplines.append(AnalyticDiscipline(expressions))
+        dv_tag = self.__DV_TAG
+        noiser_factory = NoiserFactory()
+        noising_disciplines = []
+        expressions = {}
         for dv_name, v in uncertain_design_variables.items():
-            if dv_name in expressions:
-                continue
-
             new_dv_name = self.__get_design_variable_name(dv_name)
             design_space.rename_variable(dv_name, new_dv_name)
+            if isinstance(v, str):
+                expression = v.replace(dv_tag, new_dv_name)
+                noiser = self.__get_equivalent_noiser(expression, new_dv_name)
+                if noiser is None:
+                    expressions[dv_name] = expression
+                    continue
+            else:
+                noiser = v
+
+            noiser_name, uncertain_variable_name = noiser
             noising_disciplines.append(
-                NoiserFactory().create(v[0], new_dv_name, dv_name, v[1])
+                noiser_factory.create(
+                    noiser_name, new_dv_name, dv_name, uncertain_variable_name
+                )
             )
 
+        if expressions:
+            noising_disciplines.insert(0, AnalyticDiscipline(expressions))
+
         disciplines.insert(0, MDOChain(noising_disciplines))
 
+    @staticmethod
+    def __get_equivalent_noiser(
+        expression: str, design_variable_name: str
+    ) -> tuple[str, str] | None:
+        """Return the noising discipline equivalent to an expression if any.
+
+        An expression `"dv_x + u"` is equivalent to an
+        [AdditiveNoiser][gemseo_umdo.disciplines.additive_noiser.AdditiveNoiser]
+        and an expression `"dv_x * (1 + u)"` to a
+        [MultiplicativeNoiser][gemseo_umdo.disciplines.multiplicative_noiser.MultiplicativeNoiser];
+        these disciplines are faster than an `AnalyticDiscipline`.
+
+        Args:
+            expression: The expression of the uncertain design variable.
+            design_variable_name: The name of the design variable to be noised.
+
+        Returns:
+            The short name of the noising discipline
+            and the name of the uncertain variable
+            if the expression is equivalent to a noising discipline.
+        """  # noqa: E501
+        sympy_expression = parse_expr(expression)
+        design_variable = Symbol(design_variable_name)
+        other_symbols = sympy_expression.free_symbols - {design_variable}
+        if len(other_symbols) != 1:
+            return None
+
+        uncertain_variable = other_symbols.pop()
+        for noiser_name, noiser_expression in (
+            (AdditiveNoiser.SHORT_NAME, design_variable + uncertain_variable),
+            (
+                MultiplicativeNoiser.SHORT_NAME,
+                design_variable * (1 + uncertain_variable),
+            ),
+        ):
+            if (sympy_expression - noiser_expression).expand() == 0:
+                return noiser_name, uncertain_variable.name
+
+        return None
+
     def __get_design_variable_name(self, uncertain_design_variable_name: str) -> str:
         """Return the name of the design variable to be noised.
 
@@ -272,14 +342,15 @@ class BaseUScenario:
         )
 
     def __repr__(self) -> str:
+        disciplines, mdo_formulation, umdo_formulation = self.__formulation_description
         msg = MultiLineString()
         msg.add(self.name)
         msg.indent()
-        msg.add("Disciplines: {}", pretty_str(self.disciplines, delimiter=" "))
+        msg.add("Disciplines: {}", disciplines)
         msg.add("Formulation:")
         msg.indent()
-        msg.add("MDO formulation: {}", self.mdo_formulation.__class__.__name__)
-        msg.add("Statistic estimation: {}", self.formulation.__class__.__name__)
+        msg.add("MDO formulation: {}", mdo_formulation)
+        msg.add("Statistic estimation: {}", umdo_formulation)
         msg.dedent()
         msg.add("Uncertain space:")
         msg.indent()
@@ -22,11 +22,16 @@ from typing import Any
 
 from gemseo.utils.metaclasses import ABCGoogleDocstringInheritanceMeta
 from numpy import argmax
-from numpy import array
+from numpy import asarray
+from numpy import ascontiguousarray
+from numpy import divide
+from numpy import empty
+from numpy import full
+from numpy import multiply
 from numpy import nan
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import Sequence
 
     from numpy.typing import NDArray
@@ -65,12 +70,18 @@ class BasePilot(metaclass=ABCGoogleDocstringInheritanceMeta):
     V_l: NDArray[float]
     r"""The terms variances $\mathcal{V}_0,\ldots,\mathcal{V}_L$."""
 
+    __criterion: NDArray[float]
+    """The buffer in which the criterion is computed for each level."""
+
     __costs: NDArray[float]
     r"""The unit sampling costs of each level of the telescopic sum.
 
     Namely,
     $(\mathcal{C}_{\ell-1}+\mathcal{C}_\ell)_{\ell\in\{0,\ldots,L\}}$
     with $\mathcal{C}_{-1}=0$.
+
+    This array is shared with the multilevel algorithm,
+    which can update it in place when the costs are estimated empirically.
     """
 
     __r_l: NDArray[float]
@@ -91,15 +102,18 @@ class BasePilot(metaclass=ABCGoogleDocstringInheritanceMeta):
                 $(\mathcal{C}_{\ell-1}+\mathcal{C}_\ell)_{\ell\in\{0,\ldots,L\}}$
                 with $\mathcal{C}_{-1}=0$.
         """  # noqa: D205 D212 D415
-        self.__costs = costs
-        self.__r_l = sampling_ratios
-        self.V_l = array([nan] * len(self.__r_l))
+        # asarray does not copy float arrays,
+        # so that the updates of the costs by the algorithm are taken into account.
+        self.__costs = asarray(costs, dtype=float)
+        self.__r_l = asarray(sampling_ratios, dtype=float)
+        self.V_l = full(len(sampling_ratios), nan, dtype=float)
+        self.__criterion = empty(len(sampling_ratios))
 
     def compute_next_level_and_statistic(
         self,
-        levels: Iterable[int],
+        levels: Sequence[int],
         total_n_samples: NDArray[int],
-        samples: Sequence[NDArray[float]],
+        samples: Mapping[int, NDArray[float]],
         *pilot_parameters: Any,
     ) -> tuple[int, NDArray[float]]:
         r"""Compute the next level $\ell^*$ to sample and estimate the statistic.
@@ -107,20 +121,25 @@ class BasePilot(metaclass=ABCGoogleDocstringInheritanceMeta):
         Args:
             levels: The levels that have just been sampled.
             total_n_samples: The total number of samples of each level.
-            samples: The samples of the different quantities of each level.
+            samples: The samples of the different quantities
+                of the levels that have just been sampled.
             *pilot_parameters: The parameters of the pilot.
 
         Returns:
             The next level $\ell^*$ to sample and an estimation of the statistic.
         """
-        self.V_l = self._compute_V_l(levels, samples, *pilot_parameters)
-        # WARNING: do not replace "/ total_n_samples / total_n_samples"
-        #          by "/ total_n_samples**2"
-        #          to avoid numerical division issue due to an excessively big number.
+        self.V_l = ascontiguousarray(
+            self._compute_V_l(levels, samples, *pilot_parameters), dtype=float
+        )
+        # The criterion is computed in a float buffer
+        # so that the squares of the numbers of samples do not overflow as integers.
+        criterion = self.__criterion
+        multiply(self.__r_l, self.__costs, out=criterion)
+        criterion *= total_n_samples
+        criterion *= total_n_samples
+        divide(self.V_l, criterion, out=criterion)
         return (
-            argmax(
-                self.V_l / self.__r_l / total_n_samples / total_n_samples / self.__costs
-            ),
+            argmax(criterion),
             self._compute_statistic(),
         )
 
@@ -131,15 +150,16 @@ class BasePilot(metaclass=ABCGoogleDocstringInheritanceMeta):
     @abstractmethod
     def _compute_V_l(  # noqa: N802
         self,
-        levels: Iterable[int],
-        samples: Sequence[NDArray[float]],
+        levels: Sequence[int],
+        samples: Mapping[int, NDArray[float]],
         *pilot_parameters: Any,
     ) -> NDArray[float]:
         r"""Compute the terms variances $\mathcal{V}_0,\ldots,\mathcal{V}_L$.
 
         Args:
             levels: The previous sampled levels.
-            samples: The samples of the different quantities for each level.
+            samples: The samples of the different quantities
+                of the previous sampled levels.
             *pilot_parameters: The parameters of the pilot.
 
         Returns:
@@ -28,8 +28,13 @@ from gemseo.utils.seeder import SEED
 from gemseo.utils.string_tools import MultiLineString
 from gemseo.utils.timer import Timer
 from matplotlib import pyplot as plt
+from numpy import add
 from numpy import array
 from numpy import cumsum
+from numpy import divide
+from numpy import dot
+from numpy import empty
+from numpy import fromiter
 from numpy import isnan
 from numpy import nan
 from numpy import zeros
@@ -104,19 +109,22 @@ class MLMC:
     __current_budget: float
     """The current budget."""
 
-    __delta_n_l: list[int]
+    __delta_n_l: NDArray[int]
     """The current additional numbers of samples of each level."""
 
     __f_l: list[MDOFunction]
     r"""The models $f_0,f_1,\ldots,f_L$."""
 
+    __input_dimension: int
+    """The dimension of the uncertain space."""
+
     __minimum_budget: float
     """The minimum cost of the algorithm given the initial sample sizes per level."""
 
     __n_l: NDArray[int]
     r"""The total number of samples per level, from $\ell=0$ to $\ell=L$."""
 
-    __n_samples_history: list[list[int]]
+    __n_samples_history: list[NDArray[int]]
     """The history of the additional numbers of samples of each level."""
 
     __pilot_statistic_estimation: NDArray[float]
@@ -194,24 +202,33 @@ class MLMC:
         self._n_levels = len(self.__f_l)
 
         # Set the unit sampling costs of each level of the telescopic sum (TS).
-        C_l = array(  # noqa: N806
-            [level.cost if level.cost is not None else nan for level in levels]
+        n_levels = self._n_levels
+        self.__C_l = C_l = fromiter(  # noqa: N806
+            (level.cost if level.cost is not None else nan for level in levels),
+            float,
+            n_levels,
         )
-        self.__C_l = C_l = C_l / C_l[-1]  # noqa: N806
-        self.__total_execution_times = array([0] * self._n_levels)
-        self.__costs = array([C_l[0], *(C_l[1:] + C_l[:-1]).tolist()])
+        C_l /= C_l[-1]  # noqa: N806
+        self.__total_execution_times = zeros(n_levels)
+        self.__costs = empty(n_levels)
+        self.__update_level_costs()
 
         # Set the sampling ratios r_l of each level of the TS.
-        self.__r_l = array([level.sampling_ratio for level in levels])
+        self.__r_l = fromiter(
+            (level.sampling_ratio for level in levels), float, n_levels
+        )
 
         # Set the Monte Carlo samplers of each level of the TS.
+        self.__input_dimension = uncertain_space.dimension
         self._samplers = tuple(
-            MonteCarloSampler(uncertain_space) for _ in range(self._n_levels)
+            MonteCarloSampler(uncertain_space) for _ in range(n_levels)
         )
         self._add_functions_to_samplers()
 
         # Set the numbers of samples to be added at each level of the TS.
-        self.__delta_n_l = [level.n_initial_samples for level in levels]
+        self.__delta_n_l = fromiter(
+            (level.n_initial_samples for level in levels), "int64", n_levels
+        )
 
         # Initialize the history of numbers of samples added at each level of the TS.
         self.__n_samples_history = [self.__delta_n_l.copy()]
@@ -219,9 +236,7 @@ class MLMC:
         # Initialize the numbers of samples of each level of the TS.
         self.__n_l = array(self.__n_samples_history[0], dtype="int64")
 
-        self.__minimum_budget = sum(
-            nl * cost for nl, cost in zip(self.__n_samples_history[0], self.__costs)
-        )
+        self.__minimum_budget = dot(self.__n_l, self.__costs)
         self.__total_budget = n_samples
         self.__current_budget = self.__total_budget
         self.__budget_history = []
@@ -338,8 +353,12 @@ class MLMC:
             sampler.add_function(f_l_1)
 
         # At level 0, sample the functions f_0 and f_{-1}: x -> 0.
+        # As f_{-1} is linear, the sampler does not need to call it.
         self._samplers[0].add_function(self.__f_l[0])
-        self._samplers[0].add_function(MDOFunction(self.__zero_function, "f[-1]"))
+        self._samplers[0].add_function(
+            MDOFunction(self.__zero_function, "f[-1]"),
+            linear_kernel=(zeros((1, self.__input_dimension)), zeros(1)),
+        )
 
     @staticmethod
     def __zero_function(x: NDArray[float]) -> NDArray[float]:
@@ -353,7 +372,7 @@ class MLMC:
             The output value,
             shaped as `(1,)` or `(n_samples, 1)`.
         """
-        return array([0.0] if x.ndim == 1 else [[0.0]] * len(x))
+        return zeros(1 if x.ndim == 1 else (len(x), 1))
 
     def execute(self) -> None:
         """Execute the algorithm."""
@@ -437,7 +456,7 @@ class MLMC:
 
             # Update the history of number of samples of each level
             # (0 for all the levels, but l_star).
-            self.__delta_n_l = zeros(self._n_levels)
+            self.__delta_n_l = zeros(self._n_levels, dtype="int64")
             self.__delta_n_l[l_star] = delta_n_l_star
             self.__n_l[l_star] += delta_n_l_star
             self.__n_samples_history.extend([self.__delta_n_l.copy()])
@@ -445,10 +464,11 @@ class MLMC:
         LOGGER.info("Sampling completed")
         LOGGER.info("Results")
         LOGGER.info("   Pilot statistic = %s", self.pilot_statistic_estimation)
-        LOGGER.info("   Total cost = %s", sum(self.__n_l * self.__costs))
-        LOGGER.info("   Cost allocation")
         levels_to_total_costs = self.__n_l * self.__costs
-        levels_to_total_costs = levels_to_total_costs / sum(levels_to_total_costs)
+        cost = levels_to_total_costs.sum()
+        LOGGER.info("   Total cost = %s", cost)
+        LOGGER.info("   Cost allocation")
+        levels_to_total_costs /= cost
         for level, total_cost in enumerate(levels_to_total_costs):
             LOGGER.info("      Level %s: %s", level, f"{total_cost:.1%}")
 
@@ -461,41 +481,51 @@ class MLMC:
         for level in range(self._n_levels):
             LOGGER.info("       V_%s = %s", level, f"{self.__V_l[level]:.2e}")
 
-    def __compute_samples(self, *levels_to_be_sampled: int) -> list[NDArray[float]]:
+    def __compute_samples(
+        self, *levels_to_be_sampled: int
+    ) -> dict[int, NDArray[float]]:
         """Sample the low- & high-fidelity models at some levels of the telescoping sum.
 
         Args:
             levels_to_be_sampled: The levels of the telescoping sum to be sampled.
 
         Returns:
-            The model samples.
+            The model samples of the sampled levels.
         """
-        delta_n_l_star = [int(x) for x in self.__delta_n_l]
+        delta_n_l_star = self.__delta_n_l
         LOGGER.info("      Sampling")
         for level in range(self._n_levels):
             LOGGER.info("         delta_n_%s = %s", level, delta_n_l_star[level])
-        levels_to_samples = [array([]) for _ in range(self._n_levels)]
+        levels_to_samples = {}
         for level in levels_to_be_sampled:
             self.__seed += 1
             sampler = self._samplers[level]
             with Timer() as timer:
-                sampler(delta_n_l_star[level], self.__seed)
+                sampler(int(delta_n_l_star[level]), self.__seed)
 
             self.__total_execution_times[level] += timer.elapsed_time
             levels_to_samples[level] = sampler.output_history
 
         if self.__use_empirical_C_l:
-            self.__C_l = self.__total_execution_times / self.__total_execution_times[-1]
-            self.__costs = array([
-                self.__C_l[0],
-                *(self.__C_l[1:] + self.__C_l[:-1]).tolist(),
-            ])
-        cost = sum(delta_n_l_star * self.__costs)
+            divide(
+                self.__total_execution_times,
+                self.__total_execution_times[-1],
+                out=self.__C_l,
+            )
+            self.__update_level_costs()
+        cost = dot(delta_n_l_star, self.__costs)
         LOGGER.info("         Cost = %s", cost)
         self.__current_budget -= cost
         LOGGER.info("         Remaining budget = %s", self.__current_budget)
         return levels_to_samples
 
+    def __update_level_costs(self) -> None:
+        """Update the unit sampling costs of the levels from the model costs."""
+        costs = self.__costs
+        C_l = self.__C_l  # noqa: N806
+        costs[0] = C_l[0]
+        add(C_l[1:], C_l[:-1], out=costs[1:])
+
     def plot_evaluation_history(
         self,
         show: bool = True,
@@ -512,10 +542,11 @@ class MLMC:
             log_budget: Whether to use a log-scale for the budget.
         """
         fig, (ax1, ax2) = plt.subplots(ncols=2)
-        iterations = [i + 1 for i, _ in enumerate(self.__n_samples_history)]
+        sampling_history = self.sampling_history
+        iterations = range(1, len(sampling_history) + 1)
         ax1.plot(
             iterations,
-            cumsum(array(self.__n_samples_history), axis=0),
+            cumsum(sampling_history, axis=0),
             label=[rf"$f_{level}$" for level in range(self._n_levels)],
             marker=".",
         )
@@ -526,13 +557,14 @@ class MLMC:
         ax1.set_ylabel("Cumulated number of evaluations")
         ax1.legend(title="Simulators")
         ax1.grid(which="both")
-        data = (array(self.__n_samples_history) * self.__costs).T
+        data = (sampling_history * self.__costs).T
+        bottoms = cumsum(data, axis=0)
         ax2.bar(iterations, data[0], label=r"$f_0$")
         for index, row in enumerate(data[1:]):
             ax2.bar(
                 iterations,
                 row,
-                bottom=data[0 : index + 1].sum(0),
+                bottom=bottoms[index],
                 label=rf"$f_{index + 1}$",
             )
 
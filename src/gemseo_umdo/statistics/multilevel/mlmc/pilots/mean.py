@@ -19,15 +19,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from numpy import array
+from numpy import full
+from numpy import isnan
+from numpy import mean
+from numpy import nan
 from numpy import nanmean
 from numpy import nansum
 from numpy import nanvar
+from numpy import var
 
 from gemseo_umdo.statistics.multilevel.mlmc.pilots.base_mlmc_pilot import BaseMLMCPilot
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import Sequence
 
     from numpy.typing import NDArray
@@ -36,34 +40,49 @@ if TYPE_CHECKING:
 class Mean(BaseMLMCPilot):
     """The mean-based pilot for the MLMC algorithm."""
 
-    __delta: list[NDArray[float]]
-    r"""The samples of $Y_0-Y_{-1},Y_2-Y_1,\ldots,Y_L-Y_{L-1}$.
+    __means: NDArray[float]
+    r"""The means of $Y_0-Y_{-1},Y_2-Y_1,\ldots,Y_L-Y_{L-1}$.
 
     Namely,
-    $(Y_\ell^{(\ell,n_\ell)}-Y_{\ell-1}^{(\ell,n_\ell)})_{0\leq \ell \leq L}$
+    $(\mathbb{E}[Y_\ell^{(\ell,n_\ell)}-Y_{\ell-1}^{(\ell,n_\ell)}])
+    _{0\leq \ell \leq L}$.
+
+    Only the means of the sampled levels are updated.
+    """
+
+    __variances: NDArray[float]
+    r"""The terms variances $\mathcal{V}_0,\ldots,\mathcal{V}_L$.
+
+    Only the variances of the sampled levels are updated.
     """
 
     def __init__(  # noqa: D107
         self, sampling_ratios: NDArray[float], costs: NDArray[float]
     ) -> None:
         super().__init__(sampling_ratios, costs)
-        self.__delta = [array([]) for _ in range(len(sampling_ratios))]
+        n_levels = len(sampling_ratios)
+        self.__means = full(n_levels, nan)
+        self.__variances = full(n_levels, nan)
 
     def _compute_statistic(self) -> float:  # noqa: D102
         # El Amri et al., Eq. 28, Multilevel Surrogate-based Control Variates, 2023.
         # E_MLMC[Y] = E[Y_0] + E[Y_1] + ... + E[Y_L]
         #             E[Y_0] + E[Y_1-Y_0] + ... + E[Y_L-Y_{L-1}]
-        return nansum([nanmean(delta) for delta in self.__delta])
+        return nansum(self.__means)
 
     def _compute_V_l(  # noqa: D102 N802
         self,
-        levels: Iterable[int],
-        samples: Sequence[NDArray[float]],
+        levels: Sequence[int],
+        samples: Mapping[int, NDArray[float]],
         *pilot_parameters: Any,
     ) -> NDArray[float]:
-        for level in levels:
-            self.__delta[level] = samples[level][:, 0] - samples[level][:, 1]
-
         # El Amri et al., Multilevel Surrogate-based Control Variates, 2023.
         # Paragraph just before Eq. 33: V_l = V[Y_l-Y_{l-1}]
-        return array([nanvar(delta) for delta in self.__delta])
+        for level in levels:
+            delta = samples[level][:, 0] - samples[level][:, 1]
+            # The NaN-aware reductions are slower and are only used when needed.
+            mean_, var_ = (nanmean, nanvar) if isnan(delta).any() else (mean, var)
+            self.__means[level] = mean_(delta)
+            self.__variances[level] = var_(delta)
+
+        return self.__variances.copy()
@@ -19,15 +19,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from numpy import array
+from numpy import full
+from numpy import isnan
+from numpy import mean
+from numpy import nan
 from numpy import nanmean
 from numpy import nansum
-from numpy import nanvar
 
 from gemseo_umdo.statistics.multilevel.mlmc.pilots.base_mlmc_pilot import BaseMLMCPilot
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import Sequence
 
     from numpy.typing import NDArray
@@ -36,18 +38,19 @@ if TYPE_CHECKING:
 class Variance(BaseMLMCPilot):
     """The variance-based pilot for the MLMC algorithm."""
 
-    __delta: list[NDArray[float]]
-    r"""The samples of $Y_0-Y_{-1},Y_2-Y_1,\ldots,Y_L-Y_{L-1}$.
+    __covariances: NDArray[float]
+    r"""The covariances of $D_\ell=Y_\ell-Y_{\ell-1}$ and $S_\ell=Y_\ell+Y_{\ell-1}$.
 
     Namely,
-    $(Y_\ell^{(\ell,n_\ell)}-Y_{\ell-1}^{(\ell,n_\ell)})_{0\leq \ell \leq L}$.
+    $(\mathbb{C}[D_\ell^{(\ell,n_\ell)},S_\ell^{(\ell,n_\ell)}])_{0\leq \ell \leq L}$.
+
+    Only the covariances of the sampled levels are updated.
     """
 
-    __sigma: list[NDArray[float]]
-    r"""The samples of $Y_0+Y_{-1},Y_2+Y_1,\ldots,Y_L+Y_{L-1}$.
+    __variances: NDArray[float]
+    r"""The terms variances $\mathcal{V}_0,\ldots,\mathcal{V}_L$.
 
-    Namely,
-    $(Y_\ell^{(\ell,n_\ell)}+Y_{\ell-1}^{(\ell,n_\ell)})_{0\leq \ell \leq L}$.
+    Only the variances of the sampled levels are updated.
     """
 
     def __init__(  # noqa: D107
@@ -55,23 +58,21 @@ class Variance(BaseMLMCPilot):
     ) -> None:
         super().__init__(sampling_ratios, costs)
         n_levels = len(sampling_ratios)
-        self.__delta = [array([]) for _ in range(n_levels)]
-        self.__sigma = [array([]) for _ in range(n_levels)]
+        self.__covariances = full(n_levels, nan)
+        self.__variances = full(n_levels, nan)
 
     def _compute_statistic(self) -> float:  # noqa: D102
         # El Amri et al., Eq. 29, Multilevel Surrogate-based Control Variates, 2023.
         # Var_MLMC[Y] = sum_l Var^l[Y_l] - Var^l[Y_{l-1}]
         #             = sum_l Var^l[(D_l+S_l)/2] - Var^l[(S_l+D_l)/2]
         #               where D_l = Y_l-Y_{l-1} and S_l = Y_l+Y_{l-1}
-        return nansum([
-            nanvar((delta + sigma) / 2) - nanvar((sigma - delta) / 2)
-            for delta, sigma in zip(self.__delta, self.__sigma)
-        ])
+        #             = sum_l Cov^l[D_l,S_l]
+        return nansum(self.__covariances)
 
     def _compute_V_l(  # noqa: D102 N802
         self,
-        levels: Iterable[int],
-        samples: Sequence[NDArray[float]],
+        levels: Sequence[int],
+        samples: Mapping[int, NDArray[float]],
         *pilot_parameters: Any,
     ) -> NDArray[float]:
         # Mycek and De Lozzo, Table 1,
@@ -80,14 +81,19 @@ class Variance(BaseMLMCPilot):
         # V_l = (M4[D_l]M4[S_l])**0.5
         for level in levels:
             samples_ = samples[level]
-            self.__delta[level] = samples_[:, 0] - samples_[:, 1]
-            self.__sigma[level] = samples_.sum(1)
-
-        return array([
-            (
-                nanmean((delta - delta.mean()) ** 4)
-                * nanmean((sigma - sigma.mean()) ** 4)
-            )
-            ** 0.5
-            for delta, sigma in zip(self.__delta, self.__sigma)
-        ])
+            delta = samples_[:, 0] - samples_[:, 1]
+            sigma = samples_[:, 0] + samples_[:, 1]
+            # The NaN-aware reductions are slower and are only used when needed.
+            mean_ = nanmean if isnan(delta).any() or isnan(sigma).any() else mean
+            # The samples are centered in place once
+            # for both the covariance and the fourth central moments.
+            delta -= mean_(delta)
+            sigma -= mean_(sigma)
+            self.__covariances[level] = mean_(delta * sigma)
+            delta *= delta
+            sigma *= sigma
+            self.__variances[level] = (
+                mean_(delta * delta) * mean_(sigma * sigma)
+            ) ** 0.5
+
+        return self.__variances.copy()
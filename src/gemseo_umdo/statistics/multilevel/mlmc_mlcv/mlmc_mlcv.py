@@ -49,21 +49,22 @@ class MLMCMLCV(MLMC):
 
     _PILOT_FACTORY = MLMCMLCVPilotFactory
 
-    __g_l: tuple[MDOFunction]
-    r"""The control variates $g_0$, $g_1$, ..., $g_L$.
+    __surrogate_models: tuple[tuple[MDOFunction, ...], ...]
+    r"""The surrogate models sampled at each level.
 
-    $g_\ell$ is an approximation of $f_\ell$.
+    The surrogate models sampled at level 0
+    are control variates $g_\ell$ approximating $f_\ell$
+    while the ones sampled at level $\ell>0$
+    are control variates $h_\ell$ approximating $f_\ell-f_{\ell-1}$.
     """
 
-    __h_l: tuple[MDOFunction]
-    r"""The control variates $h_1$, ..., $h_L$.
+    __surrogate_positions: tuple[slice, ...]
+    """The positions of the surrogate models sampled at each level.
 
-    $h_\ell$ is an approximation of $f_\ell-f_{\ell-1}$.
+    See
+    [get_surrogate_positions()][gemseo_umdo.statistics.multilevel.mlmc_mlcv.mlmc_mlcv.MLMCMLCV.get_surrogate_positions].
     """
 
-    __variant: Variant
-    """A variant of the algorithm."""
-
     def __init__(  # noqa: D107
         self,
         levels: Sequence[Level],
@@ -73,18 +74,26 @@ class MLMCMLCV(MLMC):
         variant: Variant = Variant.MLMC_MLCV,
         seed: int = SEED,
     ) -> None:
-        self.__g_l = tuple(level.surrogate_model[0] for level in levels)
-        for l, g_l in enumerate(self.__g_l):  # noqa: E741
-            g_l.name = f"g[{l}]"
+        g_l = tuple(level.surrogate_model[0] for level in levels)
+        for l, g in enumerate(g_l):  # noqa: E741
+            g.name = f"g[{l}]"
 
-        self.__h_l = tuple(
+        h_l = tuple(
             level.difference_surrogate_model[0]
             for l, level in enumerate(levels)  # noqa: E741
             if l != 0
         )
-        for l, h_l in enumerate(self.__h_l):  # noqa: E741
-            h_l.name = f"h[{l + 1}]"
-        self.__variant = variant
+        for l, h in enumerate(h_l):  # noqa: E741
+            h.name = f"h[{l + 1}]"
+        n_levels = len(levels)
+        self.__surrogate_positions = tuple(
+            self.get_surrogate_positions(l, n_levels, variant)
+            for l in range(n_levels)  # noqa: E741
+        )
+        self.__surrogate_models = tuple(
+            h_l[positions] if l else g_l[positions]
+            for l, positions in enumerate(self.__surrogate_positions)  # noqa: E741
+        )
         super().__init__(
             levels,
             uncertain_space,
@@ -101,16 +110,14 @@ class MLMCMLCV(MLMC):
                 for l, level in enumerate(levels)  # noqa: E741
                 if l != 0
             ]),
-            variant,
+            self.__surrogate_positions,
         ]
 
     def _add_functions_to_samplers(self) -> None:
         # At level l, sample the models f[l] and f[l-1].
         super()._add_functions_to_samplers()
         # At level l, sample some surrogate models.
-        for l, sampler in enumerate(self._samplers):  # noqa: E741
-            positions = self.get_surrogate_positions(l, self._n_levels, self.__variant)
-            surrogate_models = self.__h_l[positions] if l else self.__g_l[positions]
+        for sampler, surrogate_models in zip(self._samplers, self.__surrogate_models):
             for surrogate_model in surrogate_models:
                 sampler.add_function(surrogate_model)
 
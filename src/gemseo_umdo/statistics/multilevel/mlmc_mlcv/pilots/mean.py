@@ -20,20 +20,19 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from numpy import array
-from numpy import cov
-from numpy import dot
+from numpy import fromiter
 from numpy import nanmean
 from numpy import nansum
 from numpy import nanvar
-from scipy.linalg import solve
+from scipy.linalg import cho_factor
+from scipy.linalg import cho_solve
 
-from gemseo_umdo.statistics.multilevel.mlmc_mlcv.mlmc_mlcv import MLMCMLCV
 from gemseo_umdo.statistics.multilevel.mlmc_mlcv.pilots.base_mlmc_mlcv_pilot import (
     BaseMLMCMLCVPilot,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Mapping
     from collections.abc import Sequence
 
     from numpy.typing import NDArray
@@ -53,33 +52,43 @@ class Mean(BaseMLMCMLCVPilot):
         # El Amri et al., Multilevel Surrogate-based Control Variates, 2023.
         # (Eq. 45, 52-57)
         # based on the linearity of the mean.
-        return nansum([nanmean(delta) for delta in self.__delta])
+        deltas = self.__delta
+        means = fromiter((nanmean(delta) for delta in deltas), float, len(deltas))
+        return nansum(means)
 
     def _compute_V_l(  # noqa: D102 N802
         self,
-        levels: Iterable[int],
-        samples: Sequence[NDArray[float]],
+        levels: Sequence[int],
+        samples: Mapping[int, NDArray[float]],
         *pilot_parameters: Any,
     ) -> NDArray[float]:
-        g_means, h_means, mlmc_mlcv_variant = pilot_parameters
+        g_means, h_means, surrogate_positions = pilot_parameters
         for level in levels:
             samples_ = samples[level]
-            f_delta = (samples_[:, 0] - samples_[:, 1]).reshape((-1, 1))  # noqa: N806
-            if mlmc_mlcv_variant == MLMCMLCV.Variant.MLMC_CV_0 and level != 0:
-                self.__delta[level] = f_delta.ravel()
+            f_delta = samples_[:, 0] - samples_[:, 1]  # noqa: N806
+            positions = surrogate_positions[level]
+            if positions.start == positions.stop:
+                # No surrogate model is sampled at this level.
+                self.__delta[level] = f_delta
             else:
-                positions = MLMCMLCV.get_surrogate_positions(
-                    level, len(self.V_l), mlmc_mlcv_variant
-                )
                 # In the following, "sm" stands for "surrogate model".
                 sm_means = g_means[positions] if level == 0 else h_means[positions]
                 sm_samples = samples_[:, 2:]  # noqa: N806
-                cov_f_sm = dot(  # noqa: N806
-                    f_delta.T - f_delta.mean(), sm_samples - sm_samples.mean(axis=0)
-                ) / len(sm_samples)
-                alpha = solve(cov(sm_samples.T, bias=True), cov_f_sm.T, assume_a="pos")
-                self.__delta[level] = (
-                    f_delta - (sm_samples - sm_means) @ alpha
-                ).ravel()
+                n_samples = len(sm_samples)
+                # The samples of the surrogate models are centered once
+                # for both covariances.
+                centered_sm_samples = sm_samples - sm_samples.mean(axis=0)
+                # The differences are a vector,
+                # so this covariance is a matrix-vector product.
+                cov_f_sm = centered_sm_samples.T @ (f_delta - f_delta.mean())
+                cov_f_sm /= n_samples
+                cov_sm = centered_sm_samples.T @ centered_sm_samples
+                cov_sm /= n_samples
+                # The covariance matrix of the surrogate models is positive definite.
+                alpha = cho_solve(
+                    cho_factor(cov_sm, overwrite_a=True), cov_f_sm, overwrite_b=True
+                )
+                self.__delta[level] = f_delta - (sm_samples - sm_means) @ alpha
 
-        return array([nanvar(delta) for delta in self.__delta])
+        deltas = self.__delta
+        return fromiter((nanvar(delta) for delta in deltas), float, len(deltas))
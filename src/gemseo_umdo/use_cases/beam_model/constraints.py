@@ -58,7 +58,6 @@ class BeamConstraints(Discipline):
         }
 
     def _run(self, input_data: StrKeyMapping) -> None:
-        self.io.data[self.__C_STRESS] = (
-            self.io.data[self.__SIGMA_VM] / self.io.data[sigma_all.name]
-        )
-        self.io.data[self.__C_DISPL] = self.io.data[self.__DISPL] / 100.0
+        data = self.io.data
+        data[self.__C_STRESS] = data[self.__SIGMA_VM] / data[sigma_all.name]
+        data[self.__C_DISPL] = data[self.__DISPL] / 100.0
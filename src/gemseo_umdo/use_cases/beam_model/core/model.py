@@ -16,12 +16,16 @@
 
 from __future__ import annotations
 
-from numpy import cos
+from math import cos
+from math import sin
+from typing import TYPE_CHECKING
+
+from numpy import empty_like
 from numpy import hstack
 from numpy import linspace
 from numpy import meshgrid
+from numpy import multiply
 from numpy import sign
-from numpy import sin
 from numpy import sqrt
 
 from gemseo_umdo.use_cases.beam_model.core.output_data import BeamModelOutputData
@@ -38,6 +42,9 @@ from gemseo_umdo.use_cases.beam_model.core.variables import nu
 from gemseo_umdo.use_cases.beam_model.core.variables import rho
 from gemseo_umdo.use_cases.beam_model.core.variables import t
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 
 class BeamModel:
     r"""The beam model.
@@ -100,14 +107,49 @@ class BeamModel:
         - $\sigma_{\text{VM}} = \sqrt{\sigma^2 + 3\tau^2}$
     """
 
+    __unit_y: NDArray[float]
+    """The $y$-coordinates of the $yz$-grid for a beam of unit width."""
+
+    __unit_z: NDArray[float]
+    """The $z$-coordinates of the $yz$-grid for a beam of unit height."""
+
+    __unit_yz_grid: NDArray[float]
+    """The coordinates of the unit $yz$-grid, shaped as `(n_y * n_z, 2)`."""
+
+    __abs_unit_y: NDArray[float]
+    """The absolute values of the $y$-coordinates of the unit $yz$-grid."""
+
+    __abs_unit_z: NDArray[float]
+    """The absolute values of the $z$-coordinates of the unit $yz$-grid."""
+
+    __sign_y: NDArray[float]
+    """The signs of the $y$-coordinates of the $yz$-grid."""
+
+    __sign_z: NDArray[float]
+    """The signs of the $z$-coordinates of the $yz$-grid."""
+
     def __init__(self, n_y: int = 3, n_z: int = 3) -> None:
         """
         Args:
             n_y: The number of discretization points in the y-direction.
             n_z: The number of discretization points in the z-direction.
         """  # noqa: D205 D212 D415
-        self.__n_y = n_y
-        self.__n_z = n_z
+        # The yz-grid of a beam of width b and height h is obtained
+        # by scaling this unit grid by b along y and h along z.
+        self.__unit_y, self.__unit_z = meshgrid(
+            linspace(-0.5, 0.5, n_y), linspace(-0.5, 0.5, n_z)
+        )
+        self.__unit_yz_grid = hstack((
+            self.__unit_y.reshape((-1, 1)),
+            self.__unit_z.reshape((-1, 1)),
+        ))
+        # As b and h are positive,
+        # the signs of the coordinates do not depend on them
+        # and their absolute values are those of the unit grid scaled by them.
+        self.__abs_unit_y = abs(self.__unit_y)
+        self.__abs_unit_z = abs(self.__unit_z)
+        self.__sign_y = sign(self.__unit_y)
+        self.__sign_z = sign(self.__unit_z)
 
     def __call__(
         self,
@@ -152,28 +194,37 @@ class BeamModel:
             the von Mises stress at the root section points
             and the weight of the beam.
         """
-        y, z = meshgrid(
-            linspace(-b / 2, b / 2, self.__n_y), linspace(-h / 2, h / 2, self.__n_z)
-        )
+        y = b * self.__unit_y
+        z = h * self.__unit_z
 
         # Compute the inertia vector.
+        b_2t = b - 2 * t
+        h_2t = h - 2 * t
         I_x = 2 * (b * h) ** 2 * t / (b + h)  # noqa: N806
-        I_y = b * h**3 / 12 - (b - 2 * t) * (h - 2 * t) ** 3 / 12  # noqa: N806
-        I_z = h * b**3 / 12 - (h - 2 * t) * (b - 2 * t) ** 3 / 12  # noqa: N806
+        I_y = (b * h**3 - b_2t * h_2t**3) / 12  # noqa: N806
+        I_z = (h * b**3 - h_2t * b_2t**3) / 12  # noqa: N806
+        EI_y = E * I_y  # noqa: N806
+        EI_z = E * I_z  # noqa: N806
 
         # Compute the force vector.
+        # The angles are scalars, for which math is faster than NumPy.
         F_x = F * sin(alpha)  # noqa: N806
-        F_y = F * cos(alpha) * sin(beta)  # noqa: N806
-        F_z = F * cos(alpha) * cos(beta)  # noqa: N806
+        F_cos_alpha = F * cos(alpha)  # noqa: N806
+        F_y = F_cos_alpha * sin(beta)  # noqa: N806
+        F_z = F_cos_alpha * cos(beta)  # noqa: N806
 
         # Compute the tip moments.
         M_tip_y = F_x * dz  # noqa: N806
         M_tip_z = -F_x * dy  # noqa: N806
 
+        # Compute the normal stress due to the axial force.
+        sigma_xx = F_x / (2 * t * (b_2t + h))
+
         # Compute the strain energy.
-        U_x = F_x / 2 / t / (b + h - 2 * t) / E * L  # noqa: N806
-        U_y = F_y * L**3 / 3 / E / I_z + M_tip_z * L**2 / 2 / E / I_z  # noqa: N806
-        U_z = F_z * L**3 / 3 / E / I_y - M_tip_y * L**2 / 2 / E / I_y  # noqa: N806
+        L_2 = L**2  # noqa: N806
+        U_x_tip = sigma_xx * L / E  # noqa: N806
+        U_y_tip = L_2 * (F_y * L / 3 + M_tip_z / 2) / EI_z  # noqa: N806
+        U_z_tip = L_2 * (F_z * L / 3 - M_tip_y / 2) / EI_y  # noqa: N806
 
         # Compute the moments.
         M_x = F_z * dy - F_y * dz  # noqa: N806
@@ -181,41 +232,73 @@ class BeamModel:
         M_z = M_tip_z + F_y * L  # noqa: N806
 
         # Compute theta.
-        theta_x = M_x / (E / 2 / (1 + nu)) / I_x * L
-        theta_y = -F_z * L**2 / 2 / E / I_y + M_tip_y * L / E / I_y
-        theta_z = F_y * L**2 / 2 / E / I_z + M_tip_z * L / E / I_z
-
-        # Compute the stress.
-        sigma_xx = F_x / 2 / t / (b + h - 2 * t)
-        sigma_xy = -M_z / I_z * y
-        sigma_xz = M_y / I_y * z
-
-        # Compute S_t.
-        S_t_y = abs(y) * (h / 2 - t / 2) + (h - t) ** 2 / 8 * (  # noqa: N806
-            1 - 4 * z**2 / (h - t) ** 2
-        )
-        S_t_z = abs(z) * (b / 2 - t / 2) + (b - t) ** 2 / 8 * (  # noqa: N806
-            1 - 4 * y**2 / (b - t) ** 2
-        )
+        theta_x = 2 * (1 + nu) * M_x * L / (E * I_x)
+        theta_y = L * (M_tip_y - F_z * L / 2) / EI_y
+        theta_z = L * (M_tip_z + F_y * L / 2) / EI_z
+
+        # The fields are assembled in place
+        # with a scratch array for the products of two grid arrays.
+        tmp = empty_like(y)
+
+        # Compute the normal stress.
+        sigma = z * (M_y / I_y)
+        multiply(y, -M_z / I_z, out=tmp)
+        sigma += tmp
+        sigma += sigma_xx
+
+        # Compute the torsional stress from S_t,
+        # using (h-t)^2/8*(1-4z^2/(h-t)^2) = (h-t)^2/8-z^2/2
+        # and (b-t)^2/8*(1-4y^2/(b-t)^2) = (b-t)^2/8-y^2/2.
+        h_t = h - t
+        b_t = b - t
+        tau = self.__abs_unit_y * (b * h_t / 2)
+        multiply(z, z, out=tmp)
+        tmp *= 0.5
+        tau -= tmp
+        tau += h_t**2 / 8
+        tau *= self.__sign_y
+        tau *= F_z / I_y
+        tau_xy = self.__abs_unit_z * (h * b_t / 2)
+        multiply(y, y, out=tmp)
+        tmp *= 0.5
+        tau_xy -= tmp
+        tau_xy += b_t**2 / 8
+        tau_xy *= self.__sign_z
+        tau_xy *= -F_y / I_z
+        tau += tau_xy
+        tau += M_x / (2 * b * h * t)
 
-        # Compute the torsional stress.
-        tau_xx = M_x / 2 / b / h / t
-        tau_xy = -F_y / I_z * S_t_z * sign(z)
-        tau_xz = F_z / I_y * S_t_y * sign(y)
+        # Compute the displacements.
+        U_z = y * theta_x  # noqa: N806
+        U_z += U_z_tip  # noqa: N806
+        U_y = z * -theta_x  # noqa: N806
+        U_y += U_y_tip  # noqa: N806
+        U_x = z * theta_y  # noqa: N806
+        multiply(y, theta_z, out=tmp)
+        U_x -= tmp  # noqa: N806
+        U_x += U_x_tip  # noqa: N806
 
-        U_z = U_z + y * theta_x  # noqa: N806
-        U_y = U_y - z * theta_x  # noqa: N806
-        U_x = U_x + z * theta_y - y * theta_z  # noqa: N806
-        sigma = sigma_xz + sigma_xy + sigma_xx
-        tau = tau_xz + tau_xy + tau_xx
+        # Compute the displacement and the von Mises stress
+        # by accumulating the squares in place.
+        displ = U_x * U_x
+        multiply(U_y, U_y, out=tmp)
+        displ += tmp
+        multiply(U_z, U_z, out=tmp)
+        displ += tmp
+        sqrt(displ, out=displ)
+        sigma_vm = tau * tau
+        sigma_vm *= 3
+        multiply(sigma, sigma, out=tmp)
+        sigma_vm += tmp
+        sqrt(sigma_vm, out=sigma_vm)
         return BeamModelOutputData(
             U_x,
             U_y,
             U_z,
             sigma,
             tau,
-            sqrt(U_x**2 + U_y**2 + U_z**2),
-            sqrt(sigma**2 + 3 * tau**2),
-            2.0 * rho * L * (b + h - 2.0 * t) * t,
-            hstack((y.reshape((-1, 1)), z.reshape((-1, 1)))),
+            displ,
+            sigma_vm,
+            2.0 * rho * L * (b_2t + h) * t,
+            self.__unit_yz_grid * (b, h),
         )
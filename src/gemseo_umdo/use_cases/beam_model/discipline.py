@@ -16,12 +16,12 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from dataclasses import fields
 from typing import TYPE_CHECKING
 
 from gemseo.core.discipline.discipline import Discipline
 from numpy import array
+from numpy import atleast_1d
 
 from gemseo_umdo.use_cases.beam_model.core.model import BeamModel
 from gemseo_umdo.use_cases.beam_model.core.output_data import BeamModelOutputData
@@ -50,6 +50,12 @@ class Beam(Discipline):
         for more information about the beam model.
     """
 
+    __input_names: tuple[str, ...]
+    """The names of the inputs, in the order of the arguments of the model."""
+
+    __output_names: tuple[str, ...]
+    """The names of the outputs, in the order of the fields of the model output."""
+
     def __init__(self, n_y: int = 3, n_z: int = 3) -> None:
         """
         Args:
@@ -58,18 +64,22 @@ class Beam(Discipline):
         """  # noqa: D205 D212 D415
         super().__init__()
         input_variables = [b, h, t, L, E, alpha, beta, dy, dz, rho, F, nu]
-        self.input_grammar.update_from_names([
-            variable.name for variable in input_variables
-        ])
-        self.output_grammar.update_from_names([
-            f.name for f in fields(BeamModelOutputData)
-        ])
+        self.__input_names = tuple(variable.name for variable in input_variables)
+        self.input_grammar.update_from_names(self.__input_names)
+        self.__output_names = tuple(f.name for f in fields(BeamModelOutputData))
+        self.output_grammar.update_from_names(self.__output_names)
         self.default_input_data = {
             variable.name: array([variable.value]) for variable in input_variables
         }
         self.__beam_model = BeamModel(n_y, n_z)
 
     def _run(self, input_data: StrKeyMapping) -> None:
-        input_data = {key: val[0] for key, val in self.get_input_data().items()}
-        for name, value in asdict(self.__beam_model(**input_data)).items():
-            self.io.data[name] = value.ravel()
+        # The model is faster with Python floats than with NumPy scalars.
+        output_data = self.__beam_model(
+            *(input_data[name].item() for name in self.__input_names)
+        )
+        # asdict would deep copy the output arrays.
+        data = self.io.data
+        for name in self.__output_names:
+            # The weight is a Python float.
+            data[name] = atleast_1d(getattr(output_data, name)).ravel()
@@ -62,21 +62,18 @@ class BeamUncertainSpace(ParameterSpace):
             nominal = variable.value
             name = variable.name
             delta = deltas.pop(name, self.__DEFAULT_DELTA[name]) / 100
+            deviation = abs(nominal) * delta
             if uniform:
-                minimum, maximum = sorted([
-                    nominal * (1 - delta),
-                    nominal * (1 + delta),
-                ])
                 self.add_random_variable(
                     name,
                     "OTUniformDistribution",
-                    minimum=minimum,
-                    maximum=maximum,
+                    minimum=nominal - deviation,
+                    maximum=nominal + deviation,
                 )
             else:
                 self.add_random_variable(
                     name,
                     "OTNormalDistribution",
                     mu=nominal,
-                    sigma=abs(nominal) * delta / 3,
+                    sigma=deviation / 3,
                 )
@@ -87,6 +87,8 @@ from typing import TYPE_CHECKING
 
 from numpy import abs as np_abs
 from numpy import array
+from numpy import column_stack
+from numpy import diff
 from numpy import exp
 from numpy import linspace
 from numpy import meshgrid
@@ -95,6 +97,7 @@ from numpy import pi
 from numpy import sin
 from numpy import sum as np_sum
 from numpy import trapz
+from numpy import vstack
 from numpy import zeros
 
 from gemseo_umdo.use_cases.heat_equation.configuration import HeatEquationConfiguration
@@ -116,6 +119,27 @@ class HeatEquationModel:
     taylor_mean: float
     """The expectation of the output of the first-order Taylor polynomial."""
 
+    __trapezoidal_weights: NDArray[float]
+    """The weights of the trapezoidal rule over the mesh, shaped as `(n_nodes,)`."""
+
+    __weighted_sinus: NDArray[float]
+    """The sinus basis weighted by the trapezoidal rule.
+
+    Shaped as `(n_modes, n_nodes)`.
+    """
+
+    __F1_F2: NDArray[float]
+    r"""The functions $\mathcal{F}_1$ and $\mathcal{F}_2$ at the mesh nodes.
+
+    Shaped as `(n_nodes, 2)`.
+    """
+
+    __projected_F1_F2: NDArray[float]
+    r"""The projections of $\mathcal{F}_1$ and $\mathcal{F}_2$ on the sinus basis.
+
+    Shaped as `(n_modes, 2)`.
+    """
+
     def __init__(
         self,
         mesh_size: int = 100,
@@ -139,6 +163,13 @@ class HeatEquationModel:
         self.__modes = linspace(1, n_modes, n_modes)
         xx, nn = meshgrid(self.configuration.mesh, self.__modes, copy=False)
         self.__sinus = sin(xx * nn * pi)[:, :, newaxis]
+        # The trapezoidal rule integrates a function sampled at the mesh nodes
+        # as the dot product of these samples with weights depending on the mesh.
+        half_steps = diff(self.configuration.mesh) / 2
+        self.__trapezoidal_weights = zeros(mesh_size)
+        self.__trapezoidal_weights[:-1] += half_steps
+        self.__trapezoidal_weights[1:] += half_steps
+        self.__weighted_sinus = self.__sinus[:, :, 0] * self.__trapezoidal_weights
         self.__default_input_value = array([0.0, 0.0, 0.0, 0.005, 0.0, 0.0, 0.0])
         pi_mesh = pi * self.configuration.mesh
         self.__F1 = sin(pi_mesh)  # noqa: N806
@@ -147,10 +178,37 @@ class HeatEquationModel:
             + sin(3 * pi_mesh)
             + 50 * (sin(9 * pi_mesh) + sin(21 * pi_mesh))
         )
+        self.__F1_F2 = column_stack((self.__F1, self.__F2))  # noqa: N806
+        # As the initial temperature is G*F1+I*F2,
+        # its projection on the sinus basis is a combination
+        # of the projections of F1 and F2.
+        self.__projected_F1_F2 = self.__weighted_sinus @ self.__F1_F2  # noqa: N806
         self.__term1 = self.__term2 = self.__term3 = self.__f_at_mu_X = 0
         self.__compute_taylor_materials()
         self.taylor_mean = self.__f_at_mu_X + 600 * self.__term1
 
+    @staticmethod
+    def __compute_initial_coefficients(
+        X: NDArray[float],  # noqa: N803
+    ) -> NDArray[float]:
+        r"""Compute the coefficients of $\mathcal{F}_1$ and $\mathcal{F}_2$.
+
+        From Geraci et al., 2015 (Equation 5.2).
+
+        Args:
+            X: The input samples
+                shaped as `(sample_size, input_dimension)`.
+
+        Returns:
+            The coefficients $\mathcal{G}(\mathbf{X})$ and $\mathcal{I}(\mathbf{X})$
+            shaped as `(2, sample_size)`.
+        """
+        G = 50 * (4 * np_abs(X[:, 4:7]) - 1).prod(axis=1)  # noqa: N806
+        I = 3.5 * (  # noqa: N806, E741
+            sin(X[:, 0]) * (1 + 0.1 * X[:, 2] ** 4) + 7 * sin(X[:, 1]) ** 2
+        )
+        return vstack((G, I))
+
     def __compute_initial_temperature(
         self,
         X: NDArray[float],  # noqa: N803
@@ -166,14 +224,7 @@ class HeatEquationModel:
         Returns:
             The initial temperature for each mesh nodes.
         """
-        G = 50 * (4 * np_abs(X[:, 4:7]) - 1).T.prod(0)  # noqa: N806
-        I = 3.5 * (  # noqa: N806, E741
-            sin(X[:, 0]) + 7 * sin(X[:, 1]) ** 2 + 0.1 * X[:, 2] ** 4 * sin(X[:, 0])
-        )
-        return (
-            self.__F1[:, newaxis] * G[newaxis, :]
-            + self.__F2[:, newaxis] * I[newaxis, :]
-        )
+        return self.__F1_F2 @ self.__compute_initial_coefficients(X)
 
     def __call__(
         self, input_samples: NDArray[float] | None = None, batch_size: int = 50000
@@ -234,17 +285,15 @@ class HeatEquationModel:
             The integrated temperature shaped as `(sample_size, )`,
             the temperature at the different nodes shaped as `(sample_size, n_nodes)`.
         """
-        term = trapz(
-            self.__sinus * self.__compute_initial_temperature(X)[newaxis, :, :],
-            x=self.configuration.mesh,
-            axis=1,
-        ) * exp(
+        # Matrix products avoid (n_modes, n_nodes, n_samples) temporary arrays.
+        term = self.__projected_F1_F2 @ self.__compute_initial_coefficients(X)
+        term *= 2 * exp(
             -X[:, 3][newaxis, :]
             * (self.__modes[:, newaxis] * pi) ** 2
             * self.configuration.final_time
         )
-        u_mesh = 2 * np_sum(self.__sinus * term[:, newaxis, :], axis=0)
-        return trapz(u_mesh, x=self.configuration.mesh, axis=0), u_mesh.T
+        u_mesh = self.__sinus[:, :, 0].T @ term
+        return self.__trapezoidal_weights @ u_mesh, u_mesh.T
 
     def __compute_taylor_materials(self) -> None:
         """Compute the materials of the first-order Taylor polynomial."""
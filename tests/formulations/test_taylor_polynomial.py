@@ -15,16 +15,27 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Callable
 
 import pytest
 from gemseo import from_pickle
 from gemseo import to_pickle
+from gemseo.algos.design_space import DesignSpace
+from gemseo.algos.parameter_space import ParameterSpace
+from gemseo.core.mdo_functions.mdo_function import MDOFunction
+from gemseo.disciplines.analytic import AnalyticDiscipline
+from gemseo.formulations.disciplinary_opt import DisciplinaryOpt
 from gemseo.formulations.mdf import MDF
 from numpy import array
+from numpy import eye
 from numpy import ndarray
+from numpy import newaxis
+from numpy import ones
 from numpy.testing import assert_almost_equal
 from numpy.testing import assert_equal
 
+from gemseo_umdo.formulations._functions.hessian_function import HessianFunction
+from gemseo_umdo.formulations._functions.hessian_function import HessianStencil
 from gemseo_umdo.formulations._statistics.taylor_polynomial.margin import Margin
 from gemseo_umdo.formulations._statistics.taylor_polynomial.mean import Mean
 from gemseo_umdo.formulations._statistics.taylor_polynomial.standard_deviation import (
@@ -40,9 +51,8 @@ from gemseo_umdo.scenarios.udoe_scenario import UDOEScenario
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    from gemseo.algos.design_space import DesignSpace
-    from gemseo.algos.parameter_space import ParameterSpace
     from gemseo.core.discipline.discipline import Discipline
+    from gemseo.typing import RealArray
 
 
 @pytest.fixture
@@ -261,3 +271,165 @@ def test_second_order_approximation(umdo_formulation_with_hessian):
     constraint_value = constraint.evaluate(array([0.0] * 3))
     assert constraint_value.shape == (3, 3)
     assert_equal(constraint_value, 0.0)
+
+
+@pytest.fixture
+def recorded_function() -> tuple[Callable[[RealArray], RealArray], list[RealArray]]:
+    """The function x -> x @ x and the input data of its successive calls."""
+    input_data = []
+
+    def f(x: RealArray) -> RealArray:
+        input_data.append(x.copy())
+        return array([x @ x])
+
+    return f, input_data
+
+
+def test_hessian_function_memoization(recorded_function):
+    """Check that HessianFunction evaluates the original function once per point."""
+    f, input_data = recorded_function
+    hessian_function = HessianFunction(MDOFunction(f, "f"))
+    hessian = hessian_function.evaluate(array([1.0, 2.0]))
+    assert_almost_equal(hessian, 2 * eye(2)[newaxis], 2)
+    # The stencil includes x, x+h*e_i and x+h*e_i+h*e_j with i,j in {1,2};
+    # the points x+h*e_i are used twice and x+h*e_1+h*e_2 twice too.
+    assert len(input_data) == 6
+
+    hessian_function.evaluate(array([1.0, 2.0]))
+    # The cache is cleared before each approximation of the Hessian matrix.
+    assert len(input_data) == 12
+
+
+def test_hessian_function_memoization_high_dimension(recorded_function):
+    """Check that HessianFunction evaluates each stencil point once in dimension 4."""
+    f, input_data = recorded_function
+    hessian = HessianFunction(MDOFunction(f, "f")).evaluate(array([1.0, 2.0, 3.0, 4.0]))
+    assert_almost_equal(hessian, 2 * eye(4)[newaxis], 2)
+    # The stencil includes x, x+h*e_i and x+h*e_i+h*e_j with 1<=i<=j<=4,
+    # i.e. (4+1)(4+2)/2 distinct points.
+    assert len(input_data) == 15
+
+
+def test_hessian_stencil(recorded_function):
+    """Check that HessianFunction objects can share the Jacobian evaluations."""
+    f, input_data = recorded_function
+
+    def g(x):
+        return 2 * f(x)
+
+    stencil = HessianStencil()
+    hessian_f = HessianFunction(MDOFunction(f, "f"), stencil=stencil)
+    hessian_g = HessianFunction(MDOFunction(g, "g"), stencil=stencil)
+    x = array([1.0, 2.0])
+    assert_almost_equal(hessian_f.evaluate(x), 2 * eye(2)[newaxis], 2)
+    assert len(input_data) == 12
+    # The Jacobians of g have been computed with those of f.
+    assert_almost_equal(hessian_g.evaluate(x), 4 * eye(2)[newaxis], 2)
+    assert len(input_data) == 12
+
+    # The shared Jacobians are discarded when a Hessian function is evaluated again.
+    hessian_f.evaluate(x)
+    assert len(input_data) == 24
+
+
+@pytest.mark.parametrize(
+    ("x", "step"), [(array([0.0, 0.0]), 1e-6), (array([3e3, 4e3]), 5e-3)]
+)
+def test_hessian_function_step(recorded_function, x, step):
+    """Check that the differentiation step of HessianFunction is relative to |x|."""
+    f, input_data = recorded_function
+    hessian = HessianFunction(MDOFunction(f, "f")).evaluate(x)
+    assert_almost_equal(hessian, 2 * eye(2)[newaxis], 2)
+    assert_almost_equal(input_data[1] - x, array([step, 0.0]))
+
+
+@pytest.mark.parametrize(
+    ("sparsity_pattern", "coupling", "n_evaluations"),
+    [
+        (None, 3.0, 10),
+        (ones((3, 3), dtype=bool), 3.0, 10),
+        (array([[1, 1, 0], [1, 1, 0], [0, 0, 1]], dtype=bool), 3.0, 11),
+        (eye(3, dtype=bool), 0.0, 8),
+    ],
+)
+def test_hessian_function_sparsity_pattern(
+    recorded_function, sparsity_pattern, coupling, n_evaluations
+):
+    """Check HessianFunction with a sparsity pattern."""
+    f, input_data = recorded_function
+
+    def g(x):
+        return f(x) + coupling * x[0] * x[1] + x[2] ** 2
+
+    hessian_function = HessianFunction(MDOFunction(g, "g"), sparsity_pattern)
+    hessian = hessian_function.evaluate(array([1.0, 2.0, 3.0]))
+    expected_hessian = array([
+        [2.0, coupling, 0.0],
+        [coupling, 2.0, 0.0],
+        [0.0, 0.0, 4.0],
+    ])
+    assert_almost_equal(hessian, expected_hessian[newaxis], 2)
+    # The points are perturbed along one direction per color
+    # instead of one direction per input variable.
+    assert len(input_data) == n_evaluations
+
+
+def test_second_order_approximation_sparsity_pattern(
+    disciplines, design_space, mdo_formulation, uncertain_space
+):
+    """Check second-order approximation with a sparsity pattern."""
+    design_space = MDF(disciplines, "f", design_space).design_space
+    formulation = TaylorPolynomial(
+        disciplines,
+        "f",
+        design_space,
+        mdo_formulation,
+        uncertain_space,
+        "Mean",
+        TaylorPolynomial_Settings(
+            second_order=True, hessian_sparsity_pattern=eye(3, dtype=bool)
+        ),
+    )
+    formulation.add_constraint("c", "Mean")
+    problem = formulation.hessian_fd_problem
+    assert_equal(problem.objective.evaluate(array([0.0] * 3)), 0.0)
+    assert_equal(problem.observables[0].evaluate(array([0.0] * 3)), 0.0)
+
+
+def test_shared_evaluation_at_mean(monkeypatch):
+    """Check that the statistic functions share the evaluation at the mean."""
+    discipline = AnalyticDiscipline({"f": "x+u", "c": "x+3*u"})
+    design_space = DesignSpace()
+    design_space.add_variable("x", lower_bound=-1, upper_bound=1, value=0.0)
+    uncertain_space = ParameterSpace()
+    uncertain_space.add_random_variable("u", "OTNormalDistribution")
+    mdo_formulation = DisciplinaryOpt(
+        [discipline],
+        "f",
+        uncertain_space,
+        differentiated_input_names_substitute=["x"],
+    )
+    formulation = TaylorPolynomial(
+        [discipline],
+        "f",
+        design_space,
+        mdo_formulation,
+        uncertain_space,
+        "Variance",
+        TaylorPolynomial_Settings(),
+    )
+    formulation.add_constraint("c", "Variance")
+    evaluate_with_mean = formulation.evaluate_with_mean
+    problems = []
+
+    def _evaluate_with_mean(problem, eval_jac):
+        problems.append(problem)
+        evaluate_with_mean(problem, eval_jac)
+
+    monkeypatch.setattr(formulation, "evaluate_with_mean", _evaluate_with_mean)
+    problem = formulation.optimization_problem
+    x = array([0.5])
+    assert_almost_equal(problem.objective.evaluate(x), array([1.0]))
+    assert_almost_equal(problem.constraints[0].evaluate(x), array([9.0]))
+    # The functions have been evaluated once at the mean.
+    assert len(problems) == 1
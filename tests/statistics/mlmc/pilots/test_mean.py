@@ -43,11 +43,32 @@ def test_compute_statistic(pilot, samples):
     assert_almost_equal(statistic, -0.8)
 
 
-def test_compute_V_l_delta(pilot, samples):  # noqa: N802
-    """Check the computation of the V_l and delta."""
+def test_compute_V_l_means(pilot, samples):  # noqa: N802
+    """Check the computation of the V_l and the means of the terms."""
     V_l = pilot._compute_V_l([1], samples)  # noqa: N806
-    delta = pilot._Mean__delta
     assert_almost_equal(V_l, array([nan, 0.0025, nan]))
-    assert len(delta) == 3
-    for x, y in zip(delta, [array([]), array([-0.3, -0.4]), array([])]):
-        assert_almost_equal(x, y)
+    assert_almost_equal(pilot._Mean__means, array([nan, -0.35, nan]))
+
+
+def test_compute_V_l_nan(pilot):  # noqa: N802
+    """Check that the V_l and the means of the terms ignore the NaN samples."""
+    samples = {1: array([[1.1, 1.4], [2.1, 2.5], [nan, 3.0]])}
+    V_l = pilot._compute_V_l([1], samples)  # noqa: N806
+    assert_almost_equal(V_l, array([nan, 0.0025, nan]))
+    assert_almost_equal(pilot._Mean__means, array([nan, -0.35, nan]))
+
+
+def test_costs_updated_in_place():
+    """Check that the criterion uses the costs updated in place by the algorithm."""
+    costs = array([1.0, 2.0])
+    pilot = Mean(array([2.0, 2.0]), costs)
+    samples = {
+        0: array([[1.0, 0.0], [3.0, 0.0]]),
+        1: array([[1.0, 0.0], [3.0, 0.0]]),
+    }
+    level, _ = pilot.compute_next_level_and_statistic([0, 1], array([10, 10]), samples)
+    assert level == 0
+
+    costs[0] = 4.0
+    level, _ = pilot.compute_next_level_and_statistic([0, 1], array([10, 10]), samples)
+    assert level == 1
@@ -43,15 +43,15 @@ def test_compute_statistics(pilot, samples):
     assert_almost_equal(statistic, array([-0.105]))
 
 
-def test_compute_V_l_delta(pilot, samples):  # noqa: N802
-    """Check the computation of the V_l and delta."""
+def test_compute_V_l_covariances(pilot, samples):  # noqa: N802
+    """Check the computation of the V_l and the covariances of the terms."""
+    V_l = pilot._compute_V_l([1], samples)  # noqa: N806
+    assert_almost_equal(V_l, array([nan, 0.0027563, nan]))
+    assert_almost_equal(pilot._Variance__covariances, array([nan, -0.0525, nan]))
+
+
+def test_compute_V_l_nan(pilot):  # noqa: N802
+    """Check that the V_l ignore the NaN samples."""
+    samples = {1: array([[1.1, 1.4], [2.1, 2.5], [nan, 3.0]])}
     V_l = pilot._compute_V_l([1], samples)  # noqa: N806
-    delta = pilot._Variance__delta
-    sigma = pilot._Variance__sigma
     assert_almost_equal(V_l, array([nan, 0.0027563, nan]))
-    assert len(delta) == 3
-    assert len(sigma) == 3
-    for x, y in zip(delta, [array([]), array([-0.3, -0.4]), array([])]):
-        assert_almost_equal(x, y)
-    for x, y in zip(sigma, [array([]), array([2.5, 4.6]), array([])]):
-        assert_almost_equal(x, y)
@@ -56,3 +56,12 @@ def test_n_initial_samples(model):
     """Check n_initial_samples."""
     level = Level(model, n_initial_samples=3)
     assert level.n_initial_samples == 3
+
+
+def test_mdo_function(model):
+    """Check that an MDOFunction is wrapped into another one."""
+    function = MDOFunction(model, "g")
+    level = Level(function)
+    assert level.model is not function
+    assert level.model.name == "f"
+    assert function.name == "g"
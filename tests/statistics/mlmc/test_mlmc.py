@@ -24,6 +24,7 @@ from typing import Callable
 
 import pytest
 from gemseo.algos.parameter_space import ParameterSpace
+from gemseo.core.mdo_functions.mdo_function import MDOFunction
 from gemseo.utils.platform import PLATFORM_IS_WINDOWS
 from gemseo.utils.testing.helpers import image_comparison
 from numpy import array
@@ -74,6 +75,14 @@ def executed_mlmc(levels, uncertain_space):
     return mlmc
 
 
+def test_user_function_name(uncertain_space):
+    """Check that MLMC does not rename the functions of the user."""
+    function = MDOFunction(lambda x: 2 * x, "my_model")
+    mlmc = MLMC([Level(function), Level(function)], uncertain_space, 1000.0)
+    assert function.name == "my_model"
+    assert [f.name for f in mlmc._MLMC__f_l] == ["f[0]", "f[1]"]
+
+
 def test_seed_after_instantiation(levels, uncertain_space):
     """Check the seed at the instantiation."""
     assert MLMC(levels, uncertain_space, 1000.0)._MLMC__seed == 0
@@ -280,6 +289,39 @@ def test_mlmc_without_cost(uncertain_space):
     assert 0 < mlmc.n_total_samples[1] < mlmc.n_total_samples[0]
 
 
+def test_mlmc_without_cost_shorter_than_one_second(uncertain_space):
+    """Check that the empirical model costs account for sub-second executions."""
+
+    def create_model(factor: float) -> Callable[[NDArray[float]], NDArray[float]]:
+        """Create a model multiplying an input and waiting a few milliseconds.
+
+        Args:
+            factor: The multiplication factor.
+
+        Returns:
+            The model.
+        """
+
+        def compute_and_wait(x: NDArray[float]) -> NDArray[float]:
+            """A function multiplying an input and waiting a few milliseconds.
+
+            Args:
+                x: The input.
+
+            Returns:
+                The output.
+            """
+            sleep(0.01)
+            return factor * x
+
+        return compute_and_wait
+
+    levels = [Level(create_model(1.0)), Level(create_model(2.0))]
+    mlmc = MLMC(levels, uncertain_space, 100.0)
+    mlmc.execute()
+    assert (mlmc.model_costs > 0).all()
+
+
 def test_stop_when_sampling_is_too_expensive(caplog):
     """Check that the algorithm stops when sampling l_star is too expensive."""
     mesh_sizes = [15, 30, 60, 120]
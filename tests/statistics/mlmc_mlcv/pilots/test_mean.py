@@ -30,6 +30,20 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+def get_positions(variant: MLMCMLCV.Variant) -> tuple[slice, ...]:
+    """Return the positions of the surrogate models sampled at each level.
+
+    Args:
+        variant: The variant of the MLMC-MLCV algorithm.
+
+    Returns:
+        The positions of the surrogate models sampled at each level.
+    """
+    return tuple(
+        MLMCMLCV.get_surrogate_positions(level, 3, variant) for level in range(3)
+    )
+
+
 @pytest.fixture
 def pilot() -> Mean:
     """The mean-based pilot."""
@@ -45,12 +59,20 @@ def parameters() -> tuple[NDArray[float], NDArray[float]]:
 def test_compute_statistic(pilot, samples, parameters):
     """Check the computation of the statistic."""
     _, statistic = pilot.compute_next_level_and_statistic(
-        [1], array([30, 20, 10]), samples, *parameters, MLMCMLCV.Variant.MLMC_MLCV
+        [1],
+        array([30, 20, 10]),
+        samples,
+        *parameters,
+        get_positions(MLMCMLCV.Variant.MLMC_MLCV),
     )
     assert_almost_equal(statistic, -0.3)
 
     _, statistic = pilot.compute_next_level_and_statistic(
-        [2], array([30, 20, 10]), samples, *parameters, MLMCMLCV.Variant.MLMC_MLCV
+        [2],
+        array([30, 20, 10]),
+        samples,
+        *parameters,
+        get_positions(MLMCMLCV.Variant.MLMC_MLCV),
     )
     assert_almost_equal(statistic, -0.7)
 
@@ -71,7 +93,9 @@ def test_compute_V_l_delta(  # noqa: N802
     expected_x,  # noqa: N803
 ):
     """Check the computation of the V_l and delta."""
-    V_l = pilot._compute_V_l([1], samples, *parameters, variant)  # noqa: N806
+    V_l = pilot._compute_V_l(  # noqa: N806
+        [1], samples, *parameters, get_positions(variant)
+    )
     delta = pilot._Mean__delta
     assert_almost_equal(V_l, array([nan, expected_V_l, nan]))
     assert len(delta) == 3
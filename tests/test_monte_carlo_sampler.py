@@ -20,9 +20,13 @@ from typing import TYPE_CHECKING
 
 import pytest
 from gemseo.algos.design_space import DesignSpace
+from gemseo.algos.doe.openturns.openturns import OpenTURNS
+from gemseo.algos.parameter_space import ParameterSpace
 from numpy import array
 from numpy import array_equal
 from numpy import newaxis
+from numpy import vstack
+from numpy.testing import assert_almost_equal
 from numpy.testing import assert_equal
 
 from gemseo_umdo.monte_carlo_sampler import FunctionType
@@ -72,27 +76,21 @@ def sampler(
 
 def test_before_call(sampler):
     """Check the MonteCarloSampler before any call."""
-    assert sampler.input_history.size == 0
-    assert sampler.output_history.size == 0
+    assert sampler.input_history.shape == (0, 2)
+    assert sampler.output_history.shape == (0, 0)
 
 
 def test_add_function(input_space):
     """Check the method add_function."""
     sampler = MonteCarloSampler(input_space)
-    assert sampler._MonteCarloSampler__all_functions_are_vectorized
-    # All functions are assumed to be vectorized.
 
-    sampler.add_function(lambda x: x)
-    assert sampler._MonteCarloSampler__all_functions_are_vectorized
-    # All functions are vectorized.
-
-    sampler.add_function(lambda x: x, False)
-    assert not sampler._MonteCarloSampler__all_functions_are_vectorized
-    # A function is not vectorized.
+    def f(x):
+        return x
 
-    sampler.add_function(lambda x: x)
-    assert not sampler._MonteCarloSampler__all_functions_are_vectorized
-    # A function is not vectorized.
+    sampler.add_function(f)
+    sampler.add_function(f, False)
+    assert sampler._MonteCarloSampler__functions == [f, f]
+    assert sampler._MonteCarloSampler__functions_are_vectorized == [True, False]
 
 
 def test_call(sampler):
@@ -118,6 +116,22 @@ def test_histories(sampler):
     assert not array_equal(sampler.output_history[3:], sampler.output_history[:3])
 
 
+def test_histories_after_access(sampler):
+    """Check that the histories are read-only and include the next samples."""
+    sampler(3)
+    sampler(3)
+    assert not sampler.input_history.flags.writeable
+    assert not sampler.output_history.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        sampler.output_history[0] = 0.0
+
+    input_history = sampler.input_history
+    output_history = sampler.output_history
+    new_input_samples, new_output_samples = sampler(2)
+    assert_equal(sampler.input_history, vstack((input_history, new_input_samples)))
+    assert_equal(sampler.output_history, vstack((output_history, new_output_samples)))
+
+
 def test_call_seed(sampler):
     """Check __call__ with a new seed."""
     input_samples, output_samples = sampler(3)
@@ -132,12 +146,80 @@ def test_call_seed(sampler):
     # The default seed is 0 and at the first call, it is incremented to 1.
 
 
-def test_call_vectorized(input_space, sampler, functions):
+@pytest.mark.parametrize("is_vectorized", [False, True])
+def test_call_vectorized(input_space, sampler, functions, is_vectorized):
     """Check __call__ with a non vectorized function."""
     input_samples, output_samples = sampler(3)
     new_sampler = MonteCarloSampler(input_space)
     new_sampler.add_function(functions[0], is_vectorized=False)
-    new_sampler.add_function(functions[1])
+    new_sampler.add_function(functions[1], is_vectorized=is_vectorized)
     new_input_samples, new_output_samples = new_sampler(3)
     assert_equal(input_samples, new_input_samples)
     assert_equal(output_samples, new_output_samples)
+
+
+@pytest.mark.parametrize("is_vectorized", [False, True])
+def test_call_output_slices(input_space, functions, is_vectorized):
+    """Check that the output samples are written in a pre-allocated array."""
+    sampler = MonteCarloSampler(input_space)
+    sampler.add_function(functions[0], is_vectorized=is_vectorized)
+    sampler.add_function(functions[1])
+    input_samples, output_samples = sampler(3)
+    assert sampler._MonteCarloSampler__output_slices == [slice(0, 2), slice(2, 3)]
+    assert_equal(output_samples[:, :2], input_samples)
+    assert_equal(output_samples[:, 2], input_samples.sum(1))
+
+    input_samples, output_samples = sampler(4)
+    assert_equal(output_samples[:, :2], input_samples)
+    assert_equal(output_samples[:, 2], input_samples.sum(1))
+
+    sampler.add_function(functions[1])
+    assert sampler._MonteCarloSampler__output_slices == []
+    assert sampler.input_history.shape == (0, 2)
+    assert sampler.output_history.shape == (0, 0)
+    input_samples, output_samples = sampler(3)
+    assert output_samples.shape == (3, 4)
+    assert_equal(output_samples[:, 3], input_samples.sum(1))
+
+
+def test_call_linear_kernel(input_space, functions):
+    """Check __call__ with linear functions."""
+    sampler = MonteCarloSampler(input_space)
+    sampler.add_function(functions[0])
+    sampler.add_function(
+        None, linear_kernel=(array([[1.0, 2.0], [3.0, 4.0]]), array([5.0, 6.0]))
+    )
+    sampler.add_function(functions[1])
+    sampler.add_function(None, linear_kernel=(array([[0.0, 0.0]]), array([0.0])))
+    for n_samples in [3, 4]:
+        input_samples, output_samples = sampler(n_samples)
+        assert output_samples.shape == (n_samples, 6)
+        assert_equal(output_samples[:, :2], input_samples)
+        assert_almost_equal(
+            output_samples[:, 2:4],
+            input_samples @ array([[1.0, 3.0], [2.0, 4.0]]) + array([5.0, 6.0]),
+        )
+        assert_equal(output_samples[:, 4], input_samples.sum(1))
+        assert_equal(output_samples[:, 5], 0.0)
+
+    assert_equal(sampler._MonteCarloSampler__linear_columns, [2, 3, 5])
+
+
+@pytest.mark.parametrize("seed", [None, 3])
+def test_parameter_space(seed):
+    """Check that the input samples from a parameter space are those of OpenTURNS."""
+    parameter_space = ParameterSpace()
+    parameter_space.add_random_variable(
+        "x", "OTNormalDistribution", size=2, mu=1.0, sigma=2.0
+    )
+    parameter_space.add_random_variable(
+        "y", "OTTriangularDistribution", minimum=0.0, mode=0.2, maximum=1.0
+    )
+    sampler = MonteCarloSampler(parameter_space)
+    sampler.add_function(lambda x: x, is_vectorized=False)
+    algo = OpenTURNS("OT_MONTE_CARLO")
+    for _ in range(2):
+        input_samples, _ = sampler(5, seed=seed)
+        assert_almost_equal(
+            input_samples, algo.compute_doe(parameter_space, n_samples=5, seed=seed)
+        )
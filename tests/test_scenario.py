@@ -140,6 +140,15 @@ def test_repr(scenario):
     assert repr(scenario) == expected
 
 
+def test_repr_update(scenario):
+    """Check that the string representation follows the uncertain space."""
+    assert repr(scenario) == repr(scenario)
+    scenario.uncertain_space.add_random_variable("v", "SPNormalDistribution")
+    assert "|  v   |" in repr(scenario)
+    scenario.name = "foo"
+    assert repr(scenario).startswith("foo\n")
+
+
 def test_mdo_formulation(scenario):
     """Check the content of the MDO formulation."""
     mdo_formulation = scenario.mdo_formulation
@@ -192,7 +201,7 @@ def test_uncertain_design_variables(disciplines, design_space, uncertain_space):
         formulation_name="MDF",
         uncertain_design_variables={
             "x0": ("+", "v0"),
-            "x1": "{}+v1",
+            "x1": "{}+2*v1",
             "x2": ("*", "v2"),
         },
         statistic_estimation_settings=Sampling_Settings(n_samples=3),
@@ -208,7 +217,7 @@ def test_uncertain_design_variables(disciplines, design_space, uncertain_space):
 
     discipline = mdo_chain.disciplines[0]
     assert isinstance(discipline, AnalyticDiscipline)
-    assert discipline.expressions == {"x1": "dv_x1+v1"}
+    assert discipline.expressions == {"x1": "dv_x1+2*v1"}
 
     discipline = mdo_chain.disciplines[1]
     assert isinstance(discipline, AdditiveNoiser)
@@ -226,7 +235,11 @@ def test_uncertain_design_variables(disciplines, design_space, uncertain_space):
     ("u1", "u2"),
     [(array([1.0]), array([-1.0])), (array([1.0, -1.0]), array([-1.0, 1.0]))],
 )
-def test_uncertain_design_variables_values(x, u1, u2):
+@pytest.mark.parametrize(
+    "uncertain_design_variables",
+    [{"x": ("+", "u")}, {"x": "{}+u"}, {"x": "u + {}"}],
+)
+def test_uncertain_design_variables_values(x, u1, u2, uncertain_design_variables):
     """Check that a design variable can be noised.
 
     Here we check the disciplines.
@@ -252,12 +265,46 @@ def test_uncertain_design_variables_values(x, u1, u2):
         statistic_estimation_settings=Sampling_Settings(
             doe_algo_settings=CustomDOE_Settings(samples=vstack((u1, u2)))
         ),
-        uncertain_design_variables={"x": ("+", "u")},
+        uncertain_design_variables=uncertain_design_variables,
     )
     scenario.execute(algo_name="CustomDOE", samples=atleast_2d(x))
     assert scenario.optimization_result.f_opt == (f(x + u1) + f(x + u2)) / 2
 
 
+@pytest.mark.parametrize(
+    ("expression", "cls"),
+    [
+        ("{}+v", AdditiveNoiser),
+        ("v + {}", AdditiveNoiser),
+        ("{}*(1+v)", MultiplicativeNoiser),
+        ("(v+1)*{}", MultiplicativeNoiser),
+        ("{}+v**2", AnalyticDiscipline),
+        ("{}*v", AnalyticDiscipline),
+        ("{}+v+w", AnalyticDiscipline),
+    ],
+)
+def test_uncertain_design_variables_expression(
+    disciplines, design_space, uncertain_space, expression, cls
+):
+    """Check that an expression can be replaced by a noising discipline."""
+    scn = UMDOScenario(
+        disciplines,
+        "f",
+        design_space,
+        uncertain_space,
+        "Mean",
+        formulation_name="MDF",
+        uncertain_design_variables={"x0": expression},
+        statistic_estimation_settings=Sampling_Settings(n_samples=3),
+    )
+    assert "dv_x0" in scn.design_space
+    (discipline,) = scn.disciplines[0].disciplines
+    assert discipline.__class__ == cls
+    if cls != AnalyticDiscipline:
+        assert set(discipline.input_grammar.names) == {"dv_x0", "v"}
+        assert set(discipline.output_grammar.names) == {"x0"}
+
+
 def test_statistic_no_estimation_parameters(disciplines, design_space, uncertain_space):
     """Check that a TypeError is raised when estimation settings are missing."""
     with pytest.raises(
@@ -41,7 +41,7 @@ def test_dimension(uncertain_space):
             "F",
             (
                 "Normal(mu=-200000.0, sigma=6666.666666666667)",
-                "Uniform(lower=-220000.00000000003, upper=-180000.0)",
+                "Uniform(lower=-220000.0, upper=-180000.0)",
             ),
         ),
         (